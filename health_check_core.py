@@ -10,32 +10,202 @@ import time
 import json
 import os
 import sys
+import re
+import importlib
 from datetime import datetime, timedelta
 # 导入简化的日志配置模块
-from logger_config import getLogger, INFO, debug, info, warning, error
+from logger_config import getLogger, INFO
 import threading
 
-# Selenium相关模块采用懒加载，仅在需要时导入
-_selenium_imported = False
-webdriver = None
-By = None
-WebDriverWait = None
-EC = None
-Options = None
-
-
-def _import_selenium():
-    """按需导入Selenium模块，仅在需要时才加载"""
-    global _selenium_imported, webdriver, By, WebDriverWait, EC, Options
-    if not _selenium_imported:
-        info("正在加载Selenium模块...")
-        from selenium import webdriver
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.edge.options import Options
-        _selenium_imported = True
-        info("Selenium模块加载完成")
+# 更快的JSON解析/序列化（可选依赖），不可用时使用标准库json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 配置文件变更监听（可选依赖），不可用时回退为定时器定期检查
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    FileSystemEventHandler = object
+
+
+class _LazySymbol:
+    """Selenium类和子模块的占位代理，首次使用时解析真实对象并替换模块全局名称"""
+    __slots__ = ('_global_name', '_module_name', '_attr')
+
+    def __init__(self, global_name, module_name, attr=None):
+        self._global_name = global_name
+        self._module_name = module_name
+        self._attr = attr
+
+    def _resolve(self):
+        target = importlib.import_module(self._module_name)
+        if self._attr:
+            target = getattr(target, self._attr)
+        # 替换全局名称，之后的访问直接命中真实对象，不再经过代理
+        globals()[self._global_name] = target
+        return target
+
+    def __getattr__(self, item):
+        return getattr(self._resolve(), item)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+
+# Selenium相关模块采用懒加载，导入本模块时不执行Selenium的导入
+webdriver = _LazySymbol('webdriver', 'selenium.webdriver')
+WebDriverWait = _LazySymbol('WebDriverWait', 'selenium.webdriver.support.ui', 'WebDriverWait')
+EC = _LazySymbol('EC', 'selenium.webdriver.support.expected_conditions')
+Options = _LazySymbol('Options', 'selenium.webdriver.edge.options', 'Options')
+
+# 表单元素定位器，预先组装为(定位方式, 定位值)元组，与By.XPATH/By.TAG_NAME取值一致，
+# 定义时无需加载Selenium
+_XPATH = "xpath"
+_TAG_NAME = "tag name"
+
+_SEL_PAGE_TITLE = (_XPATH, "//*[contains(text(), '若羌县志愿者每日健康打卡')]")
+_SEL_NAME_INPUT = (_XPATH, "//input[@placeholder='请输入姓名']")
+_SEL_PHONE_INPUT = (_XPATH, "//input[@placeholder='请输入手机号']")
+_SEL_UNIT_INPUT = (_XPATH, "//input[@placeholder='请输入内容']")
+_SEL_HEALTH_OPTIONS = (_XPATH, "//span[contains(text(), '安全健康')]")
+_SEL_TEMP_INPUT = (_XPATH, "//*[contains(text(), '体温')]/following::input[@placeholder='请输入内容'][1]")
+_SEL_YES_BUTTONS = (_XPATH, "//span[contains(text(), '是')]")
+_SEL_NO_BUTTONS = (_XPATH, "//span[contains(text(), '无')]")
+_SEL_LOCATION_STATUS = (_XPATH, "//*[contains(text(), '位置')]")
+_SEL_BODY = (_TAG_NAME, "body")
+
+# 定时器单次最长等待时间（秒），到期后按墙上时钟重新校准，避免长时间等待累积时钟偏差
+_MAX_TIMER_WAIT = 3600
+
+# 驱动创建后、打开页面前执行的CDP命令：授予地理位置权限并设置模拟地理位置
+_DRIVER_SETUP_CDP_CMDS = (
+    ("Browser.grantPermissions", {
+        "origin": "https://ding.cjfx.cn",
+        "permissions": ["geolocation"]
+    }),
+    ("Emulation.setGeolocationOverride", {
+        "latitude": 39.0238,
+        "longitude": 88.1663,
+        "accuracy": 100
+    }),
+)
+
+# 提交结果判定：一次正则扫描替代多次子串查找，IGNORECASE替代对整页源码调用lower()
+_SUCCESS_RE = re.compile("提交成功|提交完成|success|成功", re.IGNORECASE)
+# 同一判定在浏览器内执行，仅回传布尔值，避免通过驱动传输整页源码
+_SUCCESS_JS = "/提交成功|提交完成|success|成功/i.test(document.body ? document.body.innerText : '')"
+
+# 批量填写输入框：一次脚本调用完成XPath定位、赋值和input/change事件派发
+# 使用原生value setter赋值，确保前端框架的数据绑定能感知到变化
+_FILL_FIELDS_JS = """
+const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+const results = [];
+for (const [xpath, value] of arguments[0]) {
+    const el = document.evaluate(xpath, document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!el) {
+        results.push(false);
+        continue;
+    }
+    el.focus();
+    setter.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    results.push(true);
+}
+return results;
+"""
+
+# 填写单个输入框：一次脚本调用完成清空、赋值和input/change事件派发
+_SET_VALUE_JS = """
+const el = arguments[0];
+const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+el.focus();
+setter.call(el, arguments[1]);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+# 滚动元素到视口中央并返回其中心坐标，滚动为即时完成，无需额外等待
+_SCROLL_AND_CENTER_JS = """
+const el = arguments[0];
+el.scrollIntoView({block: 'center'});
+const r = el.getBoundingClientRect();
+return [r.left + r.width / 2, r.top + r.height / 2];
+"""
+
+# 批量查找元素：一次脚本调用对多个XPath求值，按顺序返回各自匹配的元素列表
+_FIND_ALL_JS = """
+return arguments[0].map(function (xpath) {
+    const snapshot = document.evaluate(xpath, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const items = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        items.push(snapshot.snapshotItem(i));
+    }
+    return items;
+});
+"""
+
+# 批量点击选项：对每个XPath取第2个匹配项点击（allowFirst为true且仅1个匹配时取第1个），
+# 按顺序返回是否点击成功
+_CLICK_OPTIONS_JS = """
+return arguments[0].map(function ([xpath, allowFirst]) {
+    const snapshot = document.evaluate(xpath, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    let target = null;
+    if (snapshot.snapshotLength > 1) {
+        target = snapshot.snapshotItem(1);
+    } else if (allowFirst && snapshot.snapshotLength > 0) {
+        target = snapshot.snapshotItem(0);
+    }
+    if (!target) {
+        return false;
+    }
+    target.click();
+    return true;
+});
+"""
+
+# 表单单选项：(定位器, 描述, 仅1个匹配时是否点击第1个)
+_FORM_OPTIONS = (
+    (_SEL_HEALTH_OPTIONS, "选择安全健康状况", True),
+    (_SEL_YES_BUTTONS, "选择今日是否上班", False),
+    (_SEL_NO_BUTTONS, "选择有无离开", False),
+)
+
+_SEL_LOCATION_BUTTONS = (
+    (_XPATH, "//span[contains(text(), '获取地理位置')]"),
+    (_XPATH, "//button[contains(., '获取地理位置')]"),
+    (_XPATH, "//div[contains(text(), '获取地理位置')]"),
+)
+_SEL_SUBMIT_BUTTONS = (
+    (_XPATH, "//span[contains(text(), '提交')]"),
+    (_XPATH, "//button[contains(., '提交')]"),
+    (_XPATH, "//div[contains(text(), '提交')]"),
+)
+
+
+class _ConfigFileEventHandler(FileSystemEventHandler):
+    """配置文件事件处理器，仅在目标文件发生变化时触发回调"""
+
+    def __init__(self, config_path, on_changed):
+        super().__init__()
+        self._config_path = os.path.normcase(config_path)
+        self._on_changed = on_changed
+
+    def on_any_event(self, event):
+        # 编辑器保存时可能先写临时文件再重命名，因此同时检查目标路径
+        for path in (event.src_path, getattr(event, 'dest_path', '')):
+            if path and os.path.normcase(path) == self._config_path:
+                self._on_changed()
+                return
 
 
 class HealthCheckAutomation:
@@ -53,16 +223,31 @@ class HealthCheckAutomation:
             # 仅进行最基本的初始化，不加载任何可能占用资源的组件
             self.setup_logging()
             self.scheduler_running = False
-            self.combined_thread = None  # 合并调度和配置监控的线程
+            
+            # 配置文件路径在初始化时解析一次，之后直接复用
+            self._config_path = self._compute_config_path()
+            self._config_dir = os.path.dirname(self._config_path)
             
             # 配置文件监控相关变量
-            self.config_last_modified = 0  # 配置文件最后修改时间
-            self.config_check_interval = 30  # 优化：延长配置文件检查间隔至30秒
+            self._config_last_modified_ns = 0  # 配置文件最后修改时间（纳秒整数，避免浮点比较）
+            self.config_check_interval = 30  # 文件监听不可用时的配置检查间隔
+            self.config_observer = None  # watchdog文件监听器
+            self.config_poll_timer = None  # 文件监听不可用时的配置检查定时器
             self.running = False  # 整体运行状态
             
             # 轻量级调度器相关变量
             self.timer = None  # 定时器对象
             self.next_run_time = None  # 下次运行时间
+            self._schedule_cache_key = None  # 下次运行时间缓存键 (小时, 分钟, 日期)
+            self._schedule_cache_value = None  # 缓存的下次运行时间戳
+            # 保护定时器的取消与重新安排：定时器线程、配置监听线程和GUI线程都会重新安排任务
+            self._schedule_lock = threading.RLock()
+            self._armed_schedule = None  # 当前定时器对应的(小时, 分钟)
+            
+            # 无头模式下保持复用的浏览器实例，避免每次打卡重新启动Edge
+            self._driver = None
+            # 定时器线程和GUI线程可能同时打卡，串行化整个打卡流程，避免两次打卡争用同一浏览器实例
+            self._driver_lock = threading.Lock()
 
             # 不自动加载配置和启动线程，等待显式调用
             # 只有在实际需要时才加载配置和启动功能
@@ -82,8 +267,8 @@ class HealthCheckAutomation:
         self.logger = getLogger(__name__)
         self.logger.setLevel(INFO)
 
-    def _get_config_path(self):
-        """获取配置文件绝对路径 - 始终从可执行文件或脚本同目录读取"""
+    def _compute_config_path(self):
+        """计算配置文件绝对路径 - 始终从可执行文件或脚本同目录读取"""
         if getattr(sys, 'frozen', False):
             # 在PyInstaller打包环境中 - 从可执行文件所在目录读取
             base_path = os.path.dirname(sys.executable)
@@ -93,20 +278,41 @@ class HealthCheckAutomation:
         
         config_path = os.path.join(base_path, 'health_config.json')
         return config_path
+
+    def _get_config_path(self):
+        """获取配置文件绝对路径（初始化时已缓存）"""
+        return self._config_path
             
     def load_or_create_config(self):
         """加载配置文件 - 配置文件不存在时直接报错"""
         config_file = self._get_config_path()
-        if not os.path.exists(config_file):
+        try:
+            # 一次stat同时完成存在性检查和修改时间读取
+            st = os.stat(config_file)
+        except FileNotFoundError:
             error_msg = f"配置文件不存在: {config_file}\n请确保配置文件存在于程序目录中"
             self.logger.error(error_msg)
             raise FileNotFoundError(error_msg)
+        
+        if ORJSON_AVAILABLE:
+            with open(config_file, 'rb') as f:
+                config = orjson.loads(f.read())
         else:
             with open(config_file, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
-            
-            # 记录配置文件的最后修改时间，用于配置监控
-            self.config_last_modified = os.path.getmtime(config_file)
+                config = json.load(f)
+        
+        # 调度设置可能与GUI共享同一个字典，合并到原字典中而不是替换
+        schedule_config = getattr(self, 'schedule_config', None)
+        if isinstance(schedule_config, dict):
+            new_schedule = config.get("schedule", {})
+            schedule_config.update(new_schedule)
+            for key in [k for k in schedule_config if k not in new_schedule]:
+                del schedule_config[key]
+            config["schedule"] = schedule_config
+        self.config = config
+        
+        # 记录配置文件的最后修改时间，用于配置监控
+        self._config_last_modified_ns = st.st_mtime_ns
             
             # 移除重复的日志输出，配置加载成功信息将由GUI统一显示
 
@@ -115,8 +321,12 @@ class HealthCheckAutomation:
         # 使用_get_config_path方法获取配置文件路径，确保读取和保存使用同一个文件
         config_file = self._get_config_path()
 
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, ensure_ascii=False, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(config_file, 'wb') as f:
+                f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(config_file, 'w', encoding='utf-8') as f:
+                json.dump(self.config, f, ensure_ascii=False, indent=2)
 
     def setup_automation(self):
         """设置自动化参数 - 惰性初始化，仅在需要时调用"""
@@ -130,14 +340,24 @@ class HealthCheckAutomation:
         self.browser_config = self.config.get("browser", {})
 
     def setup_driver(self):
-        """配置浏览器驱动"""
-        # 按需导入Selenium模块
-        _import_selenium()
-        
-        edge_options = Options()
+        """配置浏览器驱动 - 无头模式下优先复用已启动的浏览器实例"""
+        headless = self.browser_config.get("headless", True)
+        if self._driver is not None:
+            if headless and self._driver_alive(self._driver):
+                self.logger.debug("复用已启动的浏览器实例")
+                return self._driver
+            # 浏览器已失效或已切换为窗口模式，关闭后重新创建
+            self.shutdown_driver()
+
+        # Selenium在此处首次被真正导入，未安装时记录错误并返回None
+        try:
+            edge_options = Options()
+        except ImportError as e:
+            self.logger.error(f"浏览器驱动初始化失败，未安装Selenium: {e}")
+            return None
 
         # 设置为无头模式（后台运行）
-        if self.browser_config.get("headless", True):
+        if headless:
             edge_options.add_argument('--headless')
 
         # 设置无头模式下的窗口大小（确保元素可见）
@@ -179,46 +399,70 @@ class HealthCheckAutomation:
 
         try:
             driver = webdriver.Edge(options=edge_options)
+            # 按超时时间缓存WebDriverWait实例，避免每次等待都重新构造
+            driver._wait_cache = {}
 
-            # 执行命令允许地理位置
-            driver.execute_cdp_cmd("Browser.grantPermissions", {
-                "origin": "https://ding.cjfx.cn",
-                "permissions": ["geolocation"]
-            })
-
-            # 设置模拟地理位置
-            driver.execute_cdp_cmd("Emulation.setGeolocationOverride", {
-                "latitude": 39.0238,
-                "longitude": 88.1663,
-                "accuracy": 100
-            })
+            # 允许地理位置并设置模拟地理位置（均在打开页面前完成）
+            for cmd, params in _DRIVER_SETUP_CDP_CMDS:
+                driver.execute_cdp_cmd(cmd, params)
 
-            # 优化：禁用图片加载以提高性能
-            driver.execute_cdp_cmd("Page.setWebLifecycleState", {"state": "active"})
             driver.set_page_load_timeout(30)  # 优化：设置页面加载超时
 
+            # 无头模式下保留实例供下次打卡复用；窗口模式每次用完即关闭，避免窗口常驻
+            if headless:
+                self._driver = driver
             return driver
         except Exception as e:
             self.logger.error(f"浏览器驱动初始化失败: {e}")
             return None
 
+    def _driver_alive(self, driver):
+        """检查浏览器实例是否仍可响应"""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def shutdown_driver(self):
+        """关闭保持复用的浏览器实例并释放资源"""
+        driver = self._driver
+        self._driver = None
+        if driver:
+            self._quit_driver(driver)
+
+    def _quit_driver(self, driver):
+        """关闭浏览器并强制垃圾回收"""
+        import gc
+        try:
+            driver.quit()
+            self.logger.info("浏览器已关闭，资源已释放")
+        except Exception as e:
+            self.logger.error(f"关闭浏览器时发生错误: {str(e)}")
+        # 强制垃圾回收，帮助释放内存
+        gc.collect()
+
+    def _wait(self, driver, timeout):
+        """获取当前驱动对应超时时间的WebDriverWait实例（按驱动缓存复用）"""
+        wait = driver._wait_cache.get(timeout)
+        if wait is None:
+            wait = driver._wait_cache[timeout] = WebDriverWait(driver, timeout)
+        return wait
+
     def wait_and_click_with_retry(self, driver, element, description, max_retries=2):
         """等待并点击元素，带重试机制"""
-        # 确保Selenium模块已导入
-        _import_selenium()
-        
         for attempt in range(max_retries):
             try:
                 # 优化：减少等待时间，使用更精确的等待条件
-                WebDriverWait(driver, 2).until(
+                self._wait(driver, 2).until(
                     EC.element_to_be_clickable(element)
                 )
                 element.click()
-                self.logger.debug(f"{description}")  # 优化：将普通操作改为debug级别日志
+                self.logger.debug("%s", description)  # 优化：将普通操作改为debug级别日志
                 return True
             except Exception as e:
                 if attempt < max_retries - 1:
-                    self.logger.debug(f"{description}失败，第{attempt + 1}次重试")
+                    self.logger.debug("%s失败，第%d次重试", description, attempt + 1)
                     # 优化：移除不必要的等待
                     continue
                 else:
@@ -226,28 +470,36 @@ class HealthCheckAutomation:
                     return False
         return False
 
-    def find_and_click_element(self, driver, description, selectors, wait_time=5):
-        """通用的元素查找和点击函数"""
-        # 确保Selenium模块已导入
-        _import_selenium()
-        
+    def _cdp_click(self, driver, element):
+        """滚动元素到视口中央，并在其中心坐标派发CDP鼠标按下/抬起事件完成点击"""
+        x, y = driver.execute_script(_SCROLL_AND_CENTER_JS, element)
+        for event_type in ("mousePressed", "mouseReleased"):
+            driver.execute_cdp_cmd("Input.dispatchMouseEvent", {
+                "type": event_type,
+                "x": x,
+                "y": y,
+                "button": "left",
+                "clickCount": 1
+            })
+
+    def find_and_click_element(self, driver, description, locators, wait_time=5):
+        """通用的元素查找和点击函数，locators为(定位方式, 定位值)元组序列"""
         try:
-            for selector_type, selector_value in selectors:
+            for locator in locators:
                 try:
-                    if selector_type == "xpath":
-                        element = WebDriverWait(driver, wait_time).until(
-                            EC.element_to_be_clickable((By.XPATH, selector_value))
-                        )
-                    elif selector_type == "css":
-                        element = WebDriverWait(driver, wait_time).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector_value))
-                        )
-
-                    # 滚动到元素
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                    time.sleep(0.5)
-
-                    # 使用带重试的点击函数
+                    element = self._wait(driver, wait_time).until(
+                        EC.element_to_be_clickable(locator)
+                    )
+
+                    # 滚动到元素并通过CDP鼠标事件点击
+                    try:
+                        self._cdp_click(driver, element)
+                        self.logger.debug("%s", description)
+                        return True
+                    except Exception:
+                        pass
+
+                    # CDP点击失败时回退到带重试的点击函数
                     if self.wait_and_click_with_retry(driver, element, description):
                         return True
 
@@ -261,39 +513,75 @@ class HealthCheckAutomation:
             self.logger.warning(f"{description}时遇到问题: {e}")
             return False
 
-    def wait_and_fill(self, driver, xpath, text, description):
+    def wait_and_fill(self, driver, locator, text, description):
         """等待并填写输入框"""
-        # 确保Selenium模块已导入
-        _import_selenium()
-        
         try:
-            element = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.XPATH, xpath))
+            element = self._wait(driver, 5).until(
+                EC.presence_of_element_located(locator)
             )
-            element.clear()
-            element.send_keys(text)
-            self.logger.info(f"{description}: {text}")
-            time.sleep(self.browser_config["wait_time"])
+            driver.execute_script(_SET_VALUE_JS, element, text)
+            self.logger.info("%s: %s", description, text)
+            time.sleep(self.browser_config.get("wait_time", 0))
             return True
         except Exception as e:
             self.logger.warning(f"{description}失败: {e}")
             return False
 
+    def find_elements_batch(self, driver, locators):
+        """通过一次execute_script查找多组XPath元素，返回与locators顺序对应的元素列表"""
+        try:
+            return driver.execute_script(_FIND_ALL_JS, [locator[1] for locator in locators])
+        except Exception as e:
+            self.logger.warning(f"批量查找元素失败，改为逐项查找: {e}")
+            return [driver.find_elements(*locator) for locator in locators]
+
+    def click_options(self, driver, options):
+        """通过一次execute_script定位并依次点击多个选项，options为(XPath定位器, 描述, 是否允许取第1个)序列"""
+        try:
+            results = driver.execute_script(
+                _CLICK_OPTIONS_JS, [[locator[1], allow_first] for locator, _, allow_first in options])
+        except Exception as e:
+            self.logger.warning(f"批量选择选项失败，改为逐项点击: {e}")
+            groups = self.find_elements_batch(driver, [locator for locator, _, _ in options])
+            for (_, description, allow_first), elements in zip(options, groups):
+                if len(elements) > 1:
+                    self.wait_and_click_with_retry(driver, elements[1], description)
+                elif allow_first and elements:
+                    self.wait_and_click_with_retry(driver, elements[0], description)
+            return
+
+        for (_, description, _), clicked in zip(options, results):
+            if clicked:
+                self.logger.debug("%s", description)
+
+    def fill_fields(self, driver, fields):
+        """通过一次execute_script批量填写输入框，fields为(XPath定位器, 文本, 描述)序列"""
+        try:
+            results = driver.execute_script(
+                _FILL_FIELDS_JS, [[locator[1], text] for locator, text, _ in fields])
+        except Exception as e:
+            self.logger.warning(f"批量填写表单失败，改为逐项填写: {e}")
+            results = [False] * len(fields)
+
+        for (locator, text, description), filled in zip(fields, results):
+            if filled:
+                self.logger.info("%s: %s", description, text)
+            else:
+                # 脚本未找到的输入框回退到逐项等待填写
+                self.wait_and_fill(driver, locator, text, description)
+
     def handle_location_and_submit(self, driver):
         """处理地理位置获取和表单提交"""
         # 获取地理位置 - 优化：减少等待时间，使用显式等待
-        location_success = self.find_and_click_element(driver, "点击获取地理位置", [
-            ("xpath", "//span[contains(text(), '获取地理位置')]"),
-            ("xpath", "//button[contains(., '获取地理位置')]"),
-            ("xpath", "//div[contains(text(), '获取地理位置')]")
-        ], wait_time=2)
+        location_success = self.find_and_click_element(driver, "点击获取地理位置",
+                                                       _SEL_LOCATION_BUTTONS, wait_time=2)
 
         if location_success:
             self.logger.debug("等待位置获取完成...")
             # 优化：使用显式等待替代固定等待
             try:
-                WebDriverWait(driver, 3).until(
-                    EC.text_to_be_present_in_element((By.XPATH, "//*[contains(text(), '位置')]"), "已获取")
+                self._wait(driver, 3).until(
+                    EC.text_to_be_present_in_element(_SEL_LOCATION_STATUS, "已获取")
                 )
             except:
                 pass  # 如果等待超时，继续执行
@@ -301,18 +589,15 @@ class HealthCheckAutomation:
             self.logger.warning("未能点击获取地理位置按钮，尝试继续提交...")
 
         # 提交表单 - 优化：减少等待时间
-        submit_success = self.find_and_click_element(driver, "点击提交", [
-            ("xpath", "//span[contains(text(), '提交')]"),
-            ("xpath", "//button[contains(., '提交')]"),
-            ("xpath", "//div[contains(text(), '提交')]")
-        ], wait_time=2)
+        submit_success = self.find_and_click_element(driver, "点击提交",
+                                                     _SEL_SUBMIT_BUTTONS, wait_time=2)
 
         if submit_success:
             self.logger.debug("等待提交完成...")
             # 优化：使用显式等待替代固定等待
             try:
-                WebDriverWait(driver, 3).until(
-                    EC.text_to_be_present_in_element((By.TAG_NAME, "body"), "成功")
+                self._wait(driver, 3).until(
+                    EC.text_to_be_present_in_element(_SEL_BODY, "成功")
                 )
             except:
                 pass  # 如果等待超时，仍然检查结果
@@ -325,10 +610,17 @@ class HealthCheckAutomation:
     def check_submission_result(self, driver):
         """检查提交结果"""
         try:
-            success_indicators = ["提交成功", "提交完成", "success", "成功"]
-            page_source = driver.page_source.lower()
-
-            if any(indicator in page_source for indicator in success_indicators):
+            try:
+                result = driver.execute_cdp_cmd("Runtime.evaluate", {
+                    "expression": _SUCCESS_JS,
+                    "returnByValue": True
+                })
+                success = result.get("result", {}).get("value", False)
+            except Exception:
+                # CDP不可用时回退到页面源码匹配
+                success = _SUCCESS_RE.search(driver.page_source) is not None
+
+            if success:
                 self.logger.info("健康打卡提交成功！")
             else:
                 self.logger.info("表单提交操作完成")
@@ -336,7 +628,15 @@ class HealthCheckAutomation:
             self.logger.info("表单提交操作完成")
 
     def fill_health_form(self):
-        """填写健康打卡表单"""
+        """填写健康打卡表单，同一时间只允许一次打卡使用复用的浏览器实例"""
+        with self._driver_lock:
+            # 等待期间上一次打卡可能已释放用户和浏览器参数，执行前从配置中恢复
+            if not hasattr(self, 'user_info'):
+                self.setup_automation()
+            return self._fill_health_form()
+
+    def _fill_health_form(self):
+        """打卡流程本体，调用方需持有_driver_lock"""
         self.logger.info("开始执行健康打卡...")
         driver = None
 
@@ -351,42 +651,21 @@ class HealthCheckAutomation:
             self.logger.debug("已打开表单页面")  # 优化：将普通操作改为debug级别日志
 
             # 等待页面加载 - 优化：使用更精确的等待条件和合理的超时时间
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//*[contains(text(), '若羌县志愿者每日健康打卡')]"))
+            self._wait(driver, 10).until(
+                EC.presence_of_element_located(_SEL_PAGE_TITLE)
             )
             # 优化：移除不必要的固定等待
 
-            # 填写表单 - 优化：合并输入操作，减少等待次数
-            self.wait_and_fill(driver, "//input[@placeholder='请输入姓名']",
-                             self.user_info["name"], "填写姓名")
-            self.wait_and_fill(driver, "//input[@placeholder='请输入手机号']",
-                             self.user_info["phone"], "填写手机号")
-            self.wait_and_fill(driver, "//input[@placeholder='请输入内容']",
-                             self.user_info["unit"], "填写服务单位")
-
-            # 选择安全健康状况
-            health_options = driver.find_elements(By.XPATH, "//span[contains(text(), '安全健康')]")
-            if health_options:
-                health_option = health_options[1] if len(health_options) > 1 else health_options[0]
-                self.wait_and_click_with_retry(driver, health_option, "选择安全健康状况")
-                # 优化：移除不必要的固定等待
-
-            # 填写体温 - 优化：使用更精确的XPATH以直接定位体温输入框
-            temp_input = driver.find_element(By.XPATH, "//*[contains(text(), '体温')]/following::input[@placeholder='请输入内容'][1]")
-            if temp_input:
-                temp_input.clear()
-                temp_input.send_keys(self.user_info["temperature"])
-                self.logger.debug(f"填写体温: {self.user_info['temperature']}")
-
-            # 选择是否上班
-            yes_buttons = driver.find_elements(By.XPATH, "//span[contains(text(), '是')]")
-            if len(yes_buttons) > 1:
-                self.wait_and_click_with_retry(driver, yes_buttons[1], "选择今日是否上班")
-
-            # 选择有无离开
-            no_buttons = driver.find_elements(By.XPATH, "//span[contains(text(), '无')]")
-            if no_buttons and len(no_buttons) > 1:
-                self.wait_and_click_with_retry(driver, no_buttons[1], "选择有无离开")
+            # 填写表单 - 优化：姓名、手机号、单位和体温合并为一次浏览器调用
+            self.fill_fields(driver, (
+                (_SEL_NAME_INPUT, self.user_info["name"], "填写姓名"),
+                (_SEL_PHONE_INPUT, self.user_info["phone"], "填写手机号"),
+                (_SEL_UNIT_INPUT, self.user_info["unit"], "填写服务单位"),
+                (_SEL_TEMP_INPUT, self.user_info["temperature"], "填写体温"),
+            ))
+
+            # 选择安全健康状况、是否上班、有无离开 - 优化：合并为一次浏览器调用
+            self.click_options(driver, _FORM_OPTIONS)
 
             # 处理地理位置和提交
             success = self.handle_location_and_submit(driver)
@@ -405,66 +684,46 @@ class HealthCheckAutomation:
             self._unload_non_essential_modules()
             
     def _cleanup_resources(self, driver=None):
-        """增强的资源释放机制 - 确保所有占用的系统资源被彻底释放"""
-        # 确保浏览器被正确关闭
-        if driver:
-            try:
-                # 增强资源清理：清除所有数据
-                driver.delete_all_cookies()
-                
-                # 使用CDP命令清理浏览器缓存和存储
-                try:
-                    # 清除浏览器缓存
-                    driver.execute_cdp_cmd('Network.clearBrowserCache', {})
-                    # 清除所有来源的存储数据
-                    driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
-                        'origin': '*',
-                        'storageTypes': 'appcache,cache,indexeddb,localstorage,serviceworkers,websql'
-                    })
-                    # 清除网络缓存
-                    driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
-                    self.logger.debug("浏览器缓存和存储数据已清除")
-                except Exception as cdp_error:
-                    # CDP命令失败不应阻止浏览器关闭
-                    self.logger.warning(f"使用CDP命令清理浏览器数据时出错: {cdp_error}")
-                
-                # 关闭浏览器
-                driver.quit()
-                self.logger.info("浏览器已关闭，资源已释放")
-                
-                # 强制垃圾回收，帮助释放内存
-                import gc
-                gc.collect()
-                
-            except Exception as e:
-                self.logger.error(f"关闭浏览器时发生错误: {str(e)}")
-                
-                # 即使出错也尝试垃圾回收
-                try:
-                    import gc
-                    gc.collect()
-                except:
-                    pass
+        """增强的资源释放机制 - 清除浏览数据；复用的实例回到空白页，其余实例直接关闭"""
+        if not driver:
+            return
         
-    def _unload_non_essential_modules(self):
-        """卸载非必要模块，帮助垃圾回收"""
-        import sys
+        try:
+            # 增强资源清理：清除所有数据
+            driver.delete_all_cookies()
+            
+            # 使用CDP命令清理浏览器缓存和存储
+            try:
+                # 清除浏览器缓存
+                driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+                # 清除所有来源的存储数据
+                driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                    'origin': '*',
+                    'storageTypes': 'appcache,cache,indexeddb,localstorage,serviceworkers,websql'
+                })
+                # 清除网络缓存
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+                self.logger.debug("浏览器缓存和存储数据已清除")
+            except Exception as cdp_error:
+                # CDP命令失败不应阻止后续处理
+                self.logger.warning(f"使用CDP命令清理浏览器数据时出错: {cdp_error}")
+            
+            if driver is self._driver:
+                # 保留实例，导航到空白页释放表单页面占用的资源
+                driver.get("about:blank")
+                self.logger.info("浏览器数据已清除，实例保留供下次打卡复用")
+                return
+        except Exception as e:
+            self.logger.error(f"清理浏览器时发生错误: {str(e)}")
+            if driver is self._driver:
+                # 复用实例状态异常，直接关闭
+                self.shutdown_driver()
+                return
         
-        # 移除Selenium相关模块引用，帮助垃圾回收
-        selenium_modules = ['selenium']
-        for module_name in selenium_modules:
-            if module_name in sys.modules:
-                try:
-                    # 记录日志但不抛出异常，避免在资源清理时出错
-                    del sys.modules[module_name]
-                    self.logger.debug(f"已移除模块: {module_name}")
-                except:
-                    pass
-                    
-        # 重置模块导入标志，允许下次重新导入
-        global _selenium_imported
-        _selenium_imported = False
+        self._quit_driver(driver)
         
+    def _unload_non_essential_modules(self):
+        """释放非必要的对象引用，帮助垃圾回收（保留已导入的Selenium模块，避免下次打卡重新导入）"""
         # 清空浏览器相关引用
         if hasattr(self, 'options'):
             delattr(self, 'options')
@@ -481,43 +740,6 @@ class HealthCheckAutomation:
         """立即运行一次"""
         return self.fill_health_form()
 
-    def combined_loop(self):
-        """优化的合并调度循环，同时处理定时任务和配置文件监控，减少CPU占用"""
-        self.logger.info("调度和配置监控线程已启动")
-        
-        # 安排首次任务执行
-        self._schedule_next_run()
-        
-        last_config_check = time.time()
-        
-        while self.running:
-            try:
-                # 获取下次任务执行时间，实现智能睡眠
-                next_run_delay = self._get_next_run_delay()
-                
-                # 如果有即将执行的任务，使用更短的睡眠时间
-                if next_run_delay > 0 and next_run_delay <= 5:  # 5秒内有任务
-                    time.sleep(0.5)  # 更频繁地检查
-                elif next_run_delay > 0:
-                    # 计算安全的睡眠时间，确保不超过配置检查间隔
-                    safe_sleep_time = min(next_run_delay / 2, self.config_check_interval / 2, 30)
-                    time.sleep(safe_sleep_time)
-                else:
-                    # 没有任务时使用配置检查间隔作为基准，但不超过30秒
-                    time.sleep(min(self.config_check_interval, 30))
-                
-                # 定期检查配置文件变化
-                current_time = time.time()
-                if current_time - last_config_check >= self.config_check_interval:
-                    self.check_config_changes()
-                    last_config_check = current_time
-                    
-            except Exception as e:
-                self.logger.error(f"调度循环中的错误: {str(e)}")
-                # 简化错误处理，减少不必要的模块导入
-                # 出错后短暂暂停再继续
-                time.sleep(5)
-                
     def _calculate_next_run_time(self):
         """计算下次运行时间"""
         if not self.schedule_config or not self.schedule_config.get("enabled", False):
@@ -527,65 +749,126 @@ class HealthCheckAutomation:
         minute = self.schedule_config["minute"]
         
         now = datetime.now()
+        
+        # 同一天内调度设置未变化且缓存时间尚未到达时，直接复用缓存结果
+        cache_key = (hour, minute, now.date())
+        if cache_key == self._schedule_cache_key and now.timestamp() < self._schedule_cache_value:
+            return self._schedule_cache_value
+        
         next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
         
         # 如果今天的时间已过，则设置为明天
         if now >= next_run:
             next_run += timedelta(days=1)
             
-        # 转换为时间戳
-        return next_run.timestamp()
+        # 转换为时间戳并缓存
+        self._schedule_cache_key = cache_key
+        self._schedule_cache_value = next_run.timestamp()
+        return self._schedule_cache_value
     
     def _schedule_next_run(self):
         """安排下次任务执行"""
-        # 先取消现有的定时器（如果有）
-        if self.timer:
-            self.timer.cancel()
-            self.timer = None
+        with self._schedule_lock:
+            # 先取消现有的定时器（如果有）
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
+                
+            # 计算下次运行时间和延迟
+            self.next_run_time = self._calculate_next_run_time()
+            self._armed_schedule = self._schedule_key(self.schedule_config) if self.next_run_time else None
+            if not self.next_run_time:
+                return
+                
+            delay = max(0, self.next_run_time - time.time())  # 确保不返回负值
             
-        # 计算下次运行时间和延迟
-        self.next_run_time = self._calculate_next_run_time()
-        if not self.next_run_time:
-            return
+            # 记录日志（日志级别未启用时跳过时间格式化）
+            if self.logger.isEnabledFor(INFO):
+                next_run_dt = datetime.fromtimestamp(self.next_run_time)
+                hours, remainder = divmod(int(delay), 3600)
+                minutes, _ = divmod(remainder, 60)
+                
+                self.logger.info("定时任务已设置，下次执行时间: %s", next_run_dt.strftime('%Y-%m-%d %H:%M:%S'))
+                self.logger.info("距离下次执行还有: %d小时%d分钟", hours, minutes)
             
-        delay = self._get_next_run_delay()
-        
-        # 记录日志
-        now = datetime.now()
-        next_run_dt = datetime.fromtimestamp(self.next_run_time)
-        hours, remainder = divmod(int(delay), 3600)
-        minutes, _ = divmod(remainder, 60)
-        
-        self.logger.info(f"定时任务已设置，下次执行时间: {next_run_dt.strftime('%Y-%m-%d %H:%M:%S')}")
-        self.logger.info(f"距离下次执行还有: {hours}小时{minutes}分钟")
-        
-        # 创建新的定时器
-        self.timer = threading.Timer(delay, self._timer_callback)
-        self.timer.daemon = True
-        self.timer.start()
+            # 创建新的定时器
+            self._arm_timer()
+    
+    def _arm_timer(self):
+        """按距离下次运行的剩余时间设置定时器，单次最长等待_MAX_TIMER_WAIT秒"""
+        with self._schedule_lock:
+            delay = max(0, self.next_run_time - time.time())
+            self.timer = threading.Timer(min(delay, _MAX_TIMER_WAIT), self._timer_callback)
+            self.timer.daemon = True
+            self.timer.start()
     
     def _timer_callback(self):
         """定时器回调函数，执行任务并重新安排下次运行"""
+        with self._schedule_lock:
+            # 定时器在触发前已被取消或替换（重新安排与触发同时发生），由新的定时器负责
+            if threading.current_thread() is not self.timer:
+                return
+            # 尚未到达运行时间（分段等待或系统时钟被调整），按当前时钟重新校准定时器
+            if self.next_run_time and time.time() < self.next_run_time:
+                if self.running:
+                    self._arm_timer()
+                return
+        
         try:
+            # 上次打卡后用户和浏览器参数已被释放，执行前从配置中恢复
+            self.setup_automation()
             # 执行打卡任务
             self.fill_health_form()
         except Exception as e:
             self.logger.error(f"执行定时任务时出错: {str(e)}")
         finally:
-            # 重新安排下次运行
-            if self.running:
-                self._schedule_next_run()
+            # 重新安排下次运行；执行期间已被重新安排（配置变化或GUI更新）时不再重复安排
+            with self._schedule_lock:
+                if self.running and self.timer is threading.current_thread():
+                    self._schedule_next_run()
     
-    def _get_next_run_delay(self):
-        """获取距离下次任务执行的延迟时间（秒）"""
-        if self.next_run_time:
-            now = time.time()
-            delay = self.next_run_time - now
-            return max(0, delay)  # 确保不返回负值
-        return -1  # 表示没有任务
-
-    def start_combined_thread(self):
-        """启动合并的调度和配置监控线程"""
+    def _start_config_observer(self):
+        """启动配置文件监听器，watchdog不可用或启动失败时返回False"""
+        if not WATCHDOG_AVAILABLE:
+            return False
+        
+        try:
+            observer = Observer()
+            observer.schedule(_ConfigFileEventHandler(self._config_path, self.check_config_changes),
+                              self._config_dir, recursive=False)
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            self.logger.warning(f"配置文件监听启动失败，改为定期检查: {e}")
+            return False
+        
+        self.config_observer = observer
+        return True
+
+    def _stop_config_observer(self):
+        """停止配置文件监听器"""
+        if self.config_observer:
+            try:
+                self.config_observer.stop()
+                self.config_observer.join(timeout=5)
+            except Exception as e:
+                self.logger.error(f"停止配置文件监听时出错: {str(e)}")
+            self.config_observer = None
+
+    def _schedule_config_poll(self):
+        """文件监听不可用时，使用定时器定期检查配置文件"""
+        self.config_poll_timer = threading.Timer(self.config_check_interval, self._config_poll_callback)
+        self.config_poll_timer.daemon = True
+        self.config_poll_timer.start()
+
+    def _config_poll_callback(self):
+        """配置检查定时器回调函数，检查后重新安排下次检查"""
+        self.check_config_changes()
+        if self.running:
+            self._schedule_config_poll()
+
+    def start(self):
+        """启动定时任务和配置监控，不再占用常驻线程"""
         if not self.schedule_config["enabled"]:
             self.logger.info("定时任务未启用，请修改配置文件")
             return
@@ -593,34 +876,55 @@ class HealthCheckAutomation:
         hour = self.schedule_config["hour"]
         minute = self.schedule_config["minute"]
 
-        self.logger.info(f"定时任务已启动，每天 {hour:02d}:{minute:02d} 自动执行")
+        self.logger.info("定时任务已启动，每天 %02d:%02d 自动执行", hour, minute)
 
-        # 启动合并的线程
+        # 定时任务由threading.Timer触发，配置变化由文件监听回调处理
         self.running = True
-        self.combined_thread = threading.Thread(target=self.combined_loop)
-        self.combined_thread.daemon = True
-        self.combined_thread.start()
+        self._schedule_next_run()
+        if not self._start_config_observer():
+            self._schedule_config_poll()
+
+    def update_schedule(self, schedule_config):
+        """应用新的调度设置：调度器已运行时重新安排下次执行，否则启动调度器"""
+        with self._schedule_lock:
+            # 配置文件监听可能已先行重新加载并安排了相同的时间，此时无需再次重新安排
+            already_armed = self.timer is not None and self._armed_schedule == self._schedule_key(schedule_config)
+            self.schedule_config = schedule_config
+            if self.running:
+                if not already_armed:
+                    self._schedule_next_run()
+                return
+        self.start()
+
+    @staticmethod
+    def _schedule_key(schedule_config):
+        """调度设置中决定定时器的部分，未启用时为None"""
+        if not schedule_config or not schedule_config.get("enabled", False):
+            return None
+        return (schedule_config["hour"], schedule_config["minute"])
 
-    def stop_combined_thread(self):
-        """停止合并的线程并释放相关资源"""
-        self.logger.info("准备停止调度和配置监控线程")
+    def stop(self):
+        """停止定时任务和配置监控并释放相关资源"""
+        self.logger.info("准备停止定时任务和配置监控")
+        
+        # 关闭保持复用的浏览器实例
+        self.shutdown_driver()
         
         # 设置运行标志为False，使线程能够自然退出
         if self.running:
             self.running = False
+            # 停止文件监听和配置检查定时器
+            self._stop_config_observer()
+            if self.config_poll_timer:
+                self.config_poll_timer.cancel()
+                self.config_poll_timer = None
             # 取消定时器
-            if self.timer:
-                self.timer.cancel()
-                self.timer = None
-                self.next_run_time = None
-            
-            # 等待线程结束
-            if self.combined_thread and self.combined_thread.is_alive():
-                try:
-                    self.combined_thread.join(timeout=5)  # 最多等待5秒
-                    self.logger.info("调度和配置监控线程已停止")
-                except Exception as e:
-                    self.logger.error(f"等待线程停止时出错: {str(e)}")
+            with self._schedule_lock:
+                if self.timer:
+                    self.timer.cancel()
+                    self.timer = None
+                    self.next_run_time = None
+                self._armed_schedule = None
             
             # 清空任务列表和重置标志
             self.scheduler_running = False
@@ -637,48 +941,43 @@ class HealthCheckAutomation:
             self.logger.info("定时任务和配置监控已停止")
 
     def check_config_changes(self):
-        """轻量级配置文件监控，仅在文件实际发生变化时才重新加载"""
+        """轻量级配置文件监控：一次stat加一次整数比较，仅在文件实际发生变化时才进入重新加载流程"""
         try:
-            # 轻量级检查：首先检查文件是否存在
-            config_path = self._get_config_path()
-            if not os.path.exists(config_path):
-                self.logger.warning("配置文件不存在: %s", config_path)
-                return
+            modified_ns = os.stat(self._config_path).st_mtime_ns
+        except OSError:
+            self.logger.warning("配置文件不存在: %s", self._config_path)
+            return
+        if modified_ns == self._config_last_modified_ns:
+            return
+        self._reload_config(modified_ns)
+
+    def _reload_config(self, modified_ns):
+        """配置文件已变化时的完整重新加载流程"""
+        # 配置文件已更改，记录日志
+        self.logger.info("检测到配置文件已更改，正在重新加载...")
+        
+        try:
+            # 保存新的修改时间（先保存时间戳，避免在加载过程中被再次触发）
+            self._config_last_modified_ns = modified_ns
             
-            # 轻量级检查：仅检查修改时间，避免不必要的文件读取
-            current_modified = os.path.getmtime(config_path)
+            # 重新加载配置文件，并使下次运行时间缓存失效
+            self.load_or_create_config()
+            self._schedule_cache_key = None
             
-            # 只有当文件确实被修改时，才执行完整的重新加载流程
-            if current_modified > self.config_last_modified:
-                # 配置文件已更改，记录日志
-                self.logger.info("检测到配置文件已更改，正在重新加载...")
-                
-                try:
-                    # 保存新的修改时间（先保存时间戳，避免在加载过程中被再次触发）
-                    self.config_last_modified = current_modified
-                    
-                    # 重新加载配置文件
-                    self.load_or_create_config()
-                    
-                    # 按需更新自动化参数
-                    if hasattr(self, 'schedule_config') or hasattr(self, 'user_info'):
-                        self.setup_automation()
-                    
-                    # 仅当调度器正在运行时才更新任务
-                    if self.running and hasattr(self, 'schedule_config') and self.schedule_config["enabled"]:
-                        # 重新安排定时任务
-                        self._schedule_next_run()
-                        hour = self.schedule_config["hour"]
-                        minute = self.schedule_config["minute"]
-                        self.logger.info(f"定时任务已更新，每天 {hour:02d}:{minute:02d} 自动执行")
-                    
-                    self.logger.info("配置文件已重新加载并应用")
-                except Exception as e:
-                    self.logger.error(f"重新加载配置文件时出错: {str(e)}")
-                    # 记录详细的异常信息
-                    # 简化错误处理，减少不必要的模块导入
-                    # 不恢复修改时间戳，因为已经更新过了
-                    # 下次检查时，如果文件未再次修改，则不会重复触发加载
+            # 按需更新自动化参数
+            if hasattr(self, 'schedule_config') or hasattr(self, 'user_info'):
+                self.setup_automation()
+            
+            # 仅当调度器正在运行时才更新任务
+            if self.running and hasattr(self, 'schedule_config') and self.schedule_config["enabled"]:
+                # 重新安排定时任务
+                self._schedule_next_run()
+                hour = self.schedule_config["hour"]
+                minute = self.schedule_config["minute"]
+                self.logger.info("定时任务已更新，每天 %02d:%02d 自动执行", hour, minute)
+            
+            self.logger.info("配置文件已重新加载并应用")
         except Exception as e:
-            self.logger.error(f"轻量级配置监控时出错: {str(e)}")
-            # 配置监控错误不应中断主循环，记录错误后继续
\ No newline at end of file
+            self.logger.error(f"重新加载配置文件时出错: {str(e)}")
+            # 不恢复修改时间戳，因为已经更新过了
+            # 下次检查时，如果文件未再次修改，则不会重复触发加载
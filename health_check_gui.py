@@ -14,21 +14,44 @@ import json
 import os
 import threading
 import time
+import collections
+import queue
+import sched
+import functools
 # 已移除schedule库，使用threading.Timer实现轻量级调度
-from datetime import datetime
 from logger_config import info, warning, error
-# 在第22行后添加
-def _get_config_path():
-    """获取配置文件绝对路径 - 始终从可执行文件或脚本同目录读取"""
-    if getattr(sys, 'frozen', False):
-        # 在PyInstaller打包环境中 - 从可执行文件所在目录读取
-        base_path = os.path.dirname(sys.executable)
-    else:
-        # 在开发环境中 - 从脚本所在目录读取
-        base_path = os.path.dirname(os.path.abspath(__file__))
-    
-    config_path = os.path.join(base_path, 'health_config.json')
-    return config_path
+
+# 更快的JSON解析/序列化（可选依赖），不可用时使用标准库json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+# 程序所在目录 - 在PyInstaller打包环境中为可执行文件所在目录，开发环境中为脚本所在目录
+# 模块导入时计算一次，配置文件和托盘图标都从该目录读取
+BASE_DIR = (os.path.dirname(sys.executable) if getattr(sys, 'frozen', False)
+            else os.path.dirname(os.path.abspath(__file__)))
+CONFIG_PATH = os.path.join(BASE_DIR, 'health_config.json')
+ICON_PATH = os.path.join(BASE_DIR, 'alien.png')
+
+# 状态显示框最多保留的日志行数，超出后每累计_LOG_TRIM_BATCH行批量清理一次
+_LOG_MAX_LINES = 50
+_LOG_TRIM_BATCH = 16
+# 主循环把队列中的日志消息写入显示框的间隔（毫秒）
+_LOG_FLUSH_INTERVAL_MS = 100
+
+# 状态页信息行：(标题, 值标签的属性名, 初始文本, 初始颜色)
+_STATUS_USER_ROWS = (
+    ("姓名", "display_name_label", "未设置", 'gray'),
+    ("电话", "display_phone_label", "未设置", 'gray'),
+    ("单位", "display_unit_label", "未设置", 'gray'),
+)
+_STATUS_AUTO_ROWS = (
+    ("自动打卡", "auto_checkin_label", "关闭", 'red'),
+    ("打卡时间", "checkin_time_label", "10:30", 'blue'),
+    ("后台模式", "headless_label", "开启", 'green'),
+)
+
 # Selenium功能已移至health_check_core.py
 SELENIUM_AVAILABLE = False
 
@@ -41,6 +64,172 @@ except ImportError:
     TRAY_AVAILABLE = False
     # Windows环境下优先确保托盘功能
 
+# 托盘图标尺寸
+_TRAY_ICON_SIZE = (32, 32)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_tray_icon(image_path):
+    """加载托盘图标 - 优先读取已缩放的缓存文件，缓存不存在或早于原图时重新缩放并写入缓存"""
+    root, ext = os.path.splitext(image_path)
+    cache_path = f"{root}_{_TRAY_ICON_SIZE[0]}{ext}"
+    try:
+        if os.stat(cache_path).st_mtime >= os.stat(image_path).st_mtime:
+            image = Image.open(cache_path)
+            image.load()
+            if image.size == _TRAY_ICON_SIZE and image.mode == 'RGBA':
+                return image
+    except OSError:
+        pass
+
+    image = Image.open(image_path)
+    image = image.resize(_TRAY_ICON_SIZE, Image.Resampling.LANCZOS)
+    if image.mode != 'RGBA':
+        image = image.convert('RGBA')
+
+    # 缓存写入失败（如目录只读）不影响图标使用
+    try:
+        image.save(cache_path)
+    except OSError:
+        pass
+    return image
+
+
+# 核心模块类的缓存，导入成功或失败都只尝试一次
+_HCA = None
+_HCA_TRIED = False
+
+
+def _get_hca():
+    """获取核心模块的HealthCheckAutomation类，导入失败时返回None"""
+    global _HCA, _HCA_TRIED
+    if _HCA_TRIED:
+        return _HCA
+    try:
+        from health_check_core import HealthCheckAutomation as _x
+        _HCA = _x
+    except Exception as e:
+        warning("核心模块导入失败: %s", e)
+        _HCA = None
+    # 导入完成后再标记，其他线程同时调用时会等待导入锁而不是拿到未完成的结果
+    _HCA_TRIED = True
+    return _HCA
+
+
+SECONDS_PER_DAY = 86400
+
+
+def _next_occurrence(hh, mm):
+    """计算下一次hh:mm的时间戳（秒），今天的时间已过则取明天"""
+    now = time.time()
+    local = time.localtime(now)
+    # 当天0点的时间戳加上目标时刻的秒数
+    target = now - (now % 1) - (local.tm_hour * 3600 + local.tm_min * 60 + local.tm_sec) + hh * 3600 + mm * 60
+    if target <= now:
+        target += SECONDS_PER_DAY
+    return target
+
+
+class CoreSchedulerAdapter:
+    """使用核心模块自带的定时器调度自动打卡
+
+    核心实例需提供update_schedule(schedule_config)和stop()，两者在创建适配器时绑定一次
+    """
+
+    def __init__(self, core, schedule_view):
+        self._core_update = core.update_schedule
+        self._core_stop = core.stop
+        self._schedule_view = schedule_view  # 与GUI共享的调度设置字典
+
+    def set_time(self, hour, minute):
+        """同步GUI的调度设置到核心模块，未运行时启动核心调度器"""
+        self._core_update(self._schedule_view)
+        info("核心调度器将在每天 %02d:%02d 执行打卡", hour, minute)
+
+    def stop(self):
+        self._core_stop()
+
+
+class LocalTimerAdapter:
+    """本地调度：单个后台线程运行sched.scheduler，到点只唤醒一次，触发后以上次目标时间为基准推进一天"""
+
+    def __init__(self, on_fire):
+        self._on_fire = on_fire
+        self._next_fire_epoch = None  # 下次触发的时间戳（秒），None表示未设置或已停止
+        self._event = None  # 当前已安排的sched事件
+        self._generation = 0  # 每次安排事件时递增，用于识别已被取消但仍在执行中的旧事件
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._wake = threading.Event()  # 安排新事件或停止时唤醒调度线程
+        self._sched = sched.scheduler(time.time, self._delay)
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def set_time(self, hour, minute):
+        """重新设置打卡时间（只在此处计算一次目标时间，之后按天推进，避免误差累积）"""
+        with self._lock:
+            self._cancel()
+            self._next_fire_epoch = _next_occurrence(hour, minute)
+            self._arm()
+        info("本地定时器已启用，打卡时间：%02d:%02d", hour, minute)
+
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+            self._next_fire_epoch = None
+            self._cancel()
+        self._wake.set()
+
+    def _run(self):
+        """调度线程主循环：执行到期事件，没有事件时阻塞等待重新设置时间或停止"""
+        while True:
+            self._sched.run()
+            # stop()的唤醒可能已被_delay消耗，需在等待前检查停止标志
+            if self._stopped:
+                return
+            self._wake.wait()
+            self._wake.clear()
+
+    def _delay(self, timeout):
+        """sched的等待函数，可被_wake提前唤醒以重新检查最早的事件"""
+        if self._wake.wait(timeout):
+            self._wake.clear()
+
+    def _cancel(self):
+        if self._event is not None:
+            try:
+                self._sched.cancel(self._event)
+            except ValueError:
+                pass  # 事件已在执行
+            self._event = None
+
+    def _arm(self):
+        """按self._next_fire_epoch安排事件并唤醒调度线程"""
+        self._generation += 1
+        self._event = self._sched.enterabs(self._next_fire_epoch, 1,
+                                           self._fire_and_reschedule, (self._generation,))
+        self._wake.set()
+
+    def _fire_and_reschedule(self, generation):
+        """事件回调：执行打卡后将目标时间推进一天并重新安排"""
+        with self._lock:
+            if generation != self._generation or self._next_fire_epoch is None:
+                return
+            self._event = None
+
+            # 基于上次的目标时间推进，而不是从当前时间重新计算
+            now = time.time()
+            lateness = now - self._next_fire_epoch
+            self._next_fire_epoch += SECONDS_PER_DAY
+            if lateness > 5 and self._next_fire_epoch <= now:
+                # 系统休眠超过一天：错过的打卡只补执行一次，并跳过已过去的整天
+                skipped_days = int((now - self._next_fire_epoch) // SECONDS_PER_DAY) + 1
+                self._next_fire_epoch += skipped_days * SECONDS_PER_DAY
+                info("本地定时器延迟 %.0f 秒触发，已跳过 %d 天", lateness, skipped_days)
+
+            # 执行打卡任务（只是交给工作线程排队，不会阻塞调度线程）
+            self._on_fire()
+            self._arm()
+
 
 class HealthCheckGUI:
     """健康打卡助手GUI界面 - 系统托盘版"""
@@ -54,25 +243,45 @@ class HealthCheckGUI:
         self._running = True
         
         # 配置文件相关变量
-        self.config_file = _get_config_path()
+        self.config_file = CONFIG_PATH
         self.status_text = None  # 状态显示框 - 必须在 create_widgets 之前初始化
-        self.config = self.load_config()  # 程序首次启动时读取配置文件
+        self._log_line_count = 0  # 状态显示框中的日志行数，避免每次插入都查询文本控件
+        # 待显示的日志消息，由主循环批量写入；显示框最多只保留_LOG_MAX_LINES行，
+        # 积压更多消息时（如窗口隐藏期间）只保留最新的部分，其余写入后也会被立即清理
+        self._log_queue = collections.deque(maxlen=_LOG_MAX_LINES)
+        self._last_ts_sec = 0  # 上一条日志时间戳对应的整秒，同一秒内复用已格式化的时间字符串
+        self._last_ts_str = ''
+        self._status_snapshot = None  # 待应用到状态页标签的(标签, 文本, 颜色)列表，由空闲回调统一应用
+        self.config = None  # 当前配置，即按文件修改时间缓存的已解析配置
+        self._config_mtime = 0  # self.config对应的配置文件修改时间（纳秒），文件未变化时无需重新读取
+        self._last_written_bytes = None  # 上次写入配置文件的内容，内容未变化时跳过写入
+        self.load_config()  # 程序首次启动时读取配置文件
+        
+        # GUI与核心模块共享同一个调度设置字典，之后只原地修改、不再重新绑定
+        self._schedule_view = self.config.setdefault("schedule", {})
         
         # 确保配置中自动打卡始终启用
-        if "schedule" not in self.config:
-            self.config["schedule"] = {}
-        self.config["schedule"]["enabled"] = True
+        self._schedule_view["enabled"] = True
         self.tray_icon = None
         self.driver = None
         
         # 初始化健康检查器变量
         self.health_checker = None
         self._core_instance = None
-        self._core_scheduler_available = False
-        self._local_scheduler_running = False
+        self._scheduler = None  # 自动打卡调度器（CoreSchedulerAdapter或LocalTimerAdapter），首次设置定时任务时选定
+        self._armed_hm = None  # 调度器当前已设置的(小时, 分钟)，调度器停止或切换时重置为None
+        self._core_cfg_mtime = None  # 核心实例上次加载配置时的文件修改时间，None表示尚未加载
+        
+        # 定时打卡任务由常驻的工作线程依次执行，避免每次触发都创建新线程
+        self._job_q = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
         
         # 托盘图标初始化标志，防止重复初始化
         self._tray_initialized = False
+        self._tray_thread = None  # 托盘事件循环线程，整个程序生命周期只创建一个
+        
+        # 后台预先导入核心模块，用户首次点击打卡时无需在界面线程中等待导入
+        threading.Thread(target=self._warm_import_core, daemon=True).start()
         
         # 进行所有设置和组件创建
         self.setup_window()
@@ -83,6 +292,9 @@ class HealthCheckGUI:
         # 注册GUI日志处理器的回调函数
         from logger_config import gui_log_handler
         gui_log_handler.set_gui_callback(self.add_status_message)
+        gui_log_handler.install_drain(self.root)
+        # 状态消息同样由主循环定期取出写入，其他线程只向队列追加
+        self.root.after(_LOG_FLUSH_INTERVAL_MS, self._flush_logs)
         
 
         
@@ -92,31 +304,32 @@ class HealthCheckGUI:
         # 应用启动时自动设置定时打卡任务
         self.root.after(1000, self.schedule_auto_checkin)
 
+    def _warm_import_core(self):
+        """在后台线程中导入核心模块，失败时由real_checkin提示"""
+        _get_hca()
+
     def setup_window(self):
         """设置主窗口、协议和位置"""
         self.root.title("健康打卡助手 v5.1 👾实现每日定时打卡")
-        self.root.geometry("550x600")
         self.root.resizable(True, True)
         
         # 设置窗口协议，处理关闭事件
         self.root.protocol("WM_DELETE_WINDOW", self.hide_to_tray)
         
         # 添加最小化到托盘的事件绑定
-        self.root.bind("<Unmap>", self.on_window_minimized)
+        self.root.bind("<Unmap>", self.on_window_minimized, add="+")
         
         # 启用窗口属性处理（适用于Linux环境下的窗口管理器）
         if sys.platform.startswith('linux'):
             try:
                 self.root.attributes('-type', 'normal')
             except Exception as e:
-                info(f"设置窗口属性失败（Linux）: {str(e)}")
+                info("设置窗口属性失败（Linux）: %s", e)
         
-        # 窗口居中
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        # 窗口居中（窗口尺寸固定为550x600，无需刷新布局后再读取实际尺寸）
+        width, height = 550, 600
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
         self.root.geometry(f"{width}x{height}+{x}+{y}")
 
 
@@ -126,7 +339,7 @@ class HealthCheckGUI:
     def setup_tray_icon(self):
         """设置系统托盘图标，防止重复初始化"""
         # 检查是否已初始化过托盘图标
-        if hasattr(self, '_tray_initialized') and self._tray_initialized:
+        if self._tray_initialized:
             info("托盘图标已初始化，跳过重复初始化")
             return
             
@@ -141,19 +354,24 @@ class HealthCheckGUI:
             # 标记托盘图标已初始化
             self._tray_initialized = True
         except Exception as e:
-            error(f"创建托盘图标失败: {str(e)}")
+            error("创建托盘图标失败: %s", e)
             self.add_status_message(f"⚠️ 创建托盘图标失败: {str(e)}")
 
 
     def create_tray_icon(self):
         """创建系统托盘图标，防止重复创建"""
+        # 托盘事件循环仍在运行时直接复用，避免再启动一个阻塞的pystray循环
+        if self._tray_thread is not None and self._tray_thread.is_alive():
+            info("托盘图标线程已在运行，跳过重复创建")
+            return
+
         # 检查是否已存在托盘图标，如果存在则停止旧图标
-        if hasattr(self, 'tray_icon') and self.tray_icon:
+        if self.tray_icon:
             try:
                 self.tray_icon.stop()
                 info("已停止旧的托盘图标")
             except Exception as e:
-                warning(f"停止旧托盘图标时出错: {e}")
+                warning("停止旧托盘图标时出错: %s", e)
             # 将托盘图标引用设为None，确保彻底清理
             self.tray_icon = None
         
@@ -180,27 +398,22 @@ class HealthCheckGUI:
         self.tray_icon.icon_size = (32, 32)
         
         # 在新线程中运行托盘图标，捕获可能的错误
+        # Icon.run()由各平台后端阻塞等待原生事件（Windows下为GetMessage），无需额外轮询
         def run_tray():
             try:
                 self.tray_icon.run ()
             except Exception as e:
                 # 托盘运行失败，记录但不抛出异常
-                warning ( f"托盘图标运行失败: {e}" )
+                warning ( "托盘图标运行失败: %s", e )
 
-        tray_thread = threading.Thread ( target=run_tray, daemon=True )
-        tray_thread.start ()
+        self._tray_thread = threading.Thread ( target=run_tray, daemon=True )
+        self._tray_thread.start ()
 
     def create_icon_image(self):
         """创建托盘图标图像"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        image_path = os.path.join(script_dir, 'alien.png')
-        image = Image.open(image_path)
-        image = image.resize((32, 32), Image.Resampling.LANCZOS)
-        
-        if image.mode != 'RGBA':
-            image = image.convert('RGBA')
+        image = _load_tray_icon(ICON_PATH)
         
-        info(f"成功加载托盘图标: {image_path}")
+        info("成功加载托盘图标: %s", ICON_PATH)
         return image
 
 
@@ -211,7 +424,10 @@ class HealthCheckGUI:
 
     def on_window_minimized(self, event):
         """窗口最小化时的处理"""
-        if str ( self.root.state () ) == "iconic":
+        # 子控件的Unmap事件（如切换页面）也会冒泡到这里，只处理主窗口自身的事件
+        if event.widget is not self.root:
+            return
+        if self.root.wm_state () == "iconic":
             self.hide_to_tray ()
 
     def show_window(self):
@@ -236,44 +452,39 @@ class HealthCheckGUI:
             self._running = False
             
             # 2. 清除定时任务（快速操作）
-            if hasattr(self, '_local_timer') and self._local_timer is not None:
-                self._local_timer.cancel()
-                self._local_timer = None
+            if self._scheduler is not None:
+                try:
+                    self._scheduler.stop()
+                except Exception:
+                    pass
+                self._scheduler = None
+                self._armed_hm = None
             
             # 3. 停止合并的线程（如果存在）
-            for checker_attr in ['health_checker', '_core_instance']:
-                if hasattr(self, checker_attr):
-                    checker = getattr(self, checker_attr)
-                    if checker and hasattr(checker, 'stop_combined_thread'):
-                        try:
-                            checker.stop_combined_thread()
-                        except Exception:
-                            pass  # 静默失败，继续清理其他资源
+            for checker in (self.health_checker, self._core_instance):
+                if checker is not None:
+                    try:
+                        checker.stop()
+                    except Exception:
+                        pass  # 静默失败，继续清理其他资源
             
             # 4. 关闭窗口（优先级高）
             if self.root:
                 try:
                     self.root.quit()
-                    self.root.update_idletasks()  # 确保所有GUI事件都被处理
-                except Exception:
-                    pass
-            
-            # 5. 等待调度器线程终止，设置超时
-            if hasattr(self, 'scheduler_thread') and self.scheduler_thread and self.scheduler_thread.is_alive():
-                try:
-                    self.scheduler_thread.join(timeout=0.5)
                 except Exception:
                     pass
             
-            # 6. 确保关闭浏览器实例（如果存在）
-            if hasattr(self, 'driver') and self.driver:
+            # 5. 确保关闭浏览器实例（如果存在）
+            # 工作线程和调度线程均为守护线程，最终由sys.exit统一回收，无需等待
+            if self.driver:
                 try:
                     self.driver.quit()
                     self.driver = None
                 except Exception:
                     pass
             
-            # 7. 在独立线程中停止托盘图标，避免阻塞
+            # 6. 在独立线程中停止托盘图标，避免阻塞
             if self.tray_icon:
                 try:
                     # 使用简单方式停止，避免创建额外线程
@@ -281,23 +492,21 @@ class HealthCheckGUI:
                 except Exception:
                     pass
             
-            # 8. 最后确保窗口被销毁
+            # 7. 最后确保窗口被销毁
             if self.root:
                 try:
                     self.root.destroy()
                 except Exception:
                     pass
             
-            # 9. 清理循环引用，帮助GC回收内存
-            for attr in ['root', 'tray_icon', 'health_checker', '_core_instance', 'status_text']:
-                if hasattr(self, attr):
-                    setattr(self, attr, None)
+            # 8. 清理循环引用，帮助GC回收内存
+            self.root = self.tray_icon = self.health_checker = self._core_instance = self.status_text = None
                     
             info("程序已完全退出")
             
         except Exception as e:
             # 简化异常处理，只记录不打印详细堆栈
-            error(f"退出程序时出错: {str(e)}")
+            error("退出程序时出错: %s", e)
             
         finally:
             # 强制终止进程，确保程序完全退出
@@ -310,6 +519,9 @@ class HealthCheckGUI:
         main_frame = ttk.Frame ( self.root, padding="10" )
         main_frame.pack ( fill=tk.BOTH, expand=True )
 
+        # 创建设置项变量（设置页面按需创建，但变量在加载设置和定时任务中始终需要）
+        self._create_setting_vars ()
+
         # 创建顶部功能按钮（只有两个）
         self._create_function_buttons ( main_frame )
 
@@ -321,6 +533,23 @@ class HealthCheckGUI:
 
 
 
+    def _create_setting_vars(self):
+        """创建设置项绑定的界面变量"""
+        user_info, schedule_config, browser_config = self._sections ()
+        self.name_var = tk.StringVar ( value=user_info.get ( "name", "" ) )
+        self.phone_var = tk.StringVar ( value=user_info.get ( "phone", "" ) )
+        self.unit_var = tk.StringVar ( value=user_info.get ( "unit", "" ) )
+        self.temperature_var = tk.StringVar ( value=user_info.get ( "temperature", "36.5" ) )
+        self.hour_var = tk.IntVar ( value=schedule_config.get ( "hour", 10 ) )
+        self.minute_var = tk.IntVar ( value=schedule_config.get ( "minute", 30 ) )
+        self.headless_var = tk.BooleanVar ( value=browser_config.get ( "headless", True ) )
+
+    def _sections(self):
+        """返回配置中的用户信息、打卡设置和浏览器设置三个分区（不存在时创建）"""
+        return (self.config.setdefault ( "user_info", {} ),
+                self.config.setdefault ( "schedule", {} ),
+                self.config.setdefault ( "browser", {} ))
+
     def _create_function_buttons(self, parent):
         """创建顶部功能按钮"""
         button_frame = ttk.Frame(parent)
@@ -347,19 +576,16 @@ class HealthCheckGUI:
         self.current_button = None
 
     def _create_function_pages(self, parent):
-        """创建功能页面"""
+        """创建功能页面 - 设置页面在首次切换时才创建"""
+        self.pages_parent = parent
+
         # 状态页面
         self.status_page = ttk.Frame ( parent )
         self._create_status_page ( self.status_page )
 
-        # 设置页面
-        self.settings_page = ttk.Frame ( parent )
-        self._create_settings_page ( self.settings_page )
-
         # 页面字典
         self.pages = {
-            'status': self.status_page,
-            'settings': self.settings_page
+            'status': self.status_page
         }
 
     def _create_status_page(self, parent):
@@ -372,37 +598,15 @@ class HealthCheckGUI:
         left_frame = ttk.LabelFrame(main_frame, text="基本信息", padding="10")
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
-        # 用户信息显示（紧凑布局）
-        info_frame = ttk.Frame(left_frame)
-        info_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        ttk.Label(info_frame, text="姓名: ").grid(row=0, column=0, sticky=tk.W, pady=3)
-        self.display_name_label = ttk.Label(info_frame, text="未设置", foreground='gray', width=15)
-        self.display_name_label.grid(row=0, column=1, sticky=tk.W, pady=3)
-        
-        ttk.Label(info_frame, text="电话: ").grid(row=1, column=0, sticky=tk.W, pady=3)
-        self.display_phone_label = ttk.Label(info_frame, text="未设置", foreground='gray', width=15)
-        self.display_phone_label.grid(row=1, column=1, sticky=tk.W, pady=3)
-        
-        ttk.Label(info_frame, text="单位: ").grid(row=2, column=0, sticky=tk.W, pady=3)
-        self.display_unit_label = ttk.Label(info_frame, text="未设置", foreground='gray', width=15)
-        self.display_unit_label.grid(row=2, column=1, sticky=tk.W, pady=3)
-        
-        # 自动打卡信息（紧凑布局）
-        auto_frame = ttk.Frame(left_frame)
-        auto_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        ttk.Label(auto_frame, text="自动打卡: ").grid(row=0, column=0, sticky=tk.W, pady=3)
-        self.auto_checkin_label = ttk.Label(auto_frame, text="关闭", foreground='red', width=8)
-        self.auto_checkin_label.grid(row=0, column=1, sticky=tk.W, pady=3)
-        
-        ttk.Label(auto_frame, text="打卡时间: ").grid(row=1, column=0, sticky=tk.W, pady=3)
-        self.checkin_time_label = ttk.Label(auto_frame, text="10:30", foreground='blue', width=8)
-        self.checkin_time_label.grid(row=1, column=1, sticky=tk.W, pady=3)
-        
-        ttk.Label(auto_frame, text="后台模式: ").grid(row=2, column=0, sticky=tk.W, pady=3)
-        self.headless_label = ttk.Label(auto_frame, text="开启", foreground='green', width=8)
-        self.headless_label.grid(row=2, column=1, sticky=tk.W, pady=3)
+        # 用户信息和自动打卡信息（紧凑布局），每组一个框架，每行为“标题 + 值”两个标签
+        for rows, width in (_STATUS_USER_ROWS, 15), (_STATUS_AUTO_ROWS, 8):
+            row_frame = ttk.Frame(left_frame)
+            row_frame.pack(fill=tk.X, pady=(0, 10))
+            for row, (caption, attr, text, fg) in enumerate(rows):
+                ttk.Label(row_frame, text=f"{caption}: ").grid(row=row, column=0, sticky=tk.W, pady=3)
+                label = ttk.Label(row_frame, text=text, foreground=fg, width=width)
+                label.grid(row=row, column=1, sticky=tk.W, pady=3)
+                setattr(self, attr, label)
         
         # 立即打卡按钮（突出显示）
         self.manual_checkin_btn = ttk.Button(left_frame, text="立即打卡",
@@ -452,55 +656,24 @@ class HealthCheckGUI:
         user_grid_frame.pack ( fill=tk.X )
 
         ttk.Label ( user_grid_frame, text="姓名: ", width=8 ).grid ( row=0, column=0, sticky=tk.E, pady=3 )
-        self.name_var = tk.StringVar ( value=self.config.get ( "user_info", {} ).get ( "name", "" ) )
         name_entry = ttk.Entry ( user_grid_frame, textvariable=self.name_var, width=20 )
         name_entry.grid ( row=0, column=1, sticky=tk.W, padx=5, pady=3 )
 
         ttk.Label ( user_grid_frame, text="电话: ", width=8 ).grid ( row=1, column=0, sticky=tk.E, pady=3 )
-        self.phone_var = tk.StringVar ( value=self.config.get ( "user_info", {} ).get ( "phone", "" ) )
         phone_entry = ttk.Entry ( user_grid_frame, textvariable=self.phone_var, width=20 )
         phone_entry.grid ( row=1, column=1, sticky=tk.W, padx=5, pady=3 )
         
-        # 添加电话号码输入验证
-        def validate_phone(new_value):
-            # 检查是否为数字且长度不超过11位
-            if new_value == "":  # 允许空输入
-                phone_entry.configure(foreground="black", style="")
-                return True
-            elif new_value.isdigit() and len(new_value) <= 11:
-                # 根据输入长度提供视觉反馈
-                if len(new_value) == 11:
-                    # 11位数字时显示为绿色，表示输入正确
-                    phone_entry.configure(foreground="green", style="")
-                else:
-                    # 少于11位数字时显示为黑色
-                    phone_entry.configure(foreground="black", style="")
-                return True
-            else:
-                # 非数字或超过11位时不接受输入
-                return False
-        
-        # 注册验证函数
-        vcmd = (self.root.register(validate_phone), '%P')
-        phone_entry.config(validate="key", validatecommand=vcmd)
-        
-        # 添加焦点离开时的验证和错误提示
-        def on_phone_entry_leave(event):
-            phone_value = self.phone_var.get()
-            if phone_value and len(phone_value) != 11:
-                # 输入了内容但不是11位数字时，显示错误提示
-                messagebox.showwarning("输入错误", "请输入有效的11位电话号码")
-                phone_entry.configure(foreground="red", style="")
-        
-        phone_entry.bind("<FocusOut>", on_phone_entry_leave)
+        # 电话号码校验：监听变量写入并防抖，停止输入后统一校验一次
+        self.phone_entry = phone_entry
+        self._phone_fg = "black"  # 当前前景色，颜色未变化时不重复调用configure
+        self._phone_after_id = None
+        self.phone_var.trace_add("write", self._on_phone_changed)
 
         ttk.Label ( user_grid_frame, text="单位: ", width=8 ).grid ( row=0, column=2, sticky=tk.E, pady=3 )
-        self.unit_var = tk.StringVar ( value=self.config.get ( "user_info", {} ).get ( "unit", "" ) )
         unit_entry = ttk.Entry ( user_grid_frame, textvariable=self.unit_var, width=20 )
         unit_entry.grid ( row=0, column=3, sticky=tk.W, padx=5, pady=3 )
 
         ttk.Label ( user_grid_frame, text="体温: ", width=8 ).grid ( row=1, column=2, sticky=tk.E, pady=3 )
-        self.temperature_var = tk.StringVar ( value=self.config.get ( "user_info", {} ).get ( "temperature", "36.5" ) )
         temp_entry = ttk.Entry ( user_grid_frame, textvariable=self.temperature_var, width=20 )
         temp_entry.grid ( row=1, column=3, sticky=tk.W, padx=5, pady=3 )
 
@@ -520,12 +693,10 @@ class HealthCheckGUI:
         time_frame = ttk.Frame ( schedule_grid_frame )
         time_frame.grid ( row=1, column=1, sticky=tk.W, padx=5, pady=3 )
 
-        self.hour_var = tk.IntVar ( value=self.config.get ( "schedule", {} ).get ( "hour", 10 ) )
         hour_spinbox = ttk.Spinbox ( time_frame, from_=0, to=23, textvariable=self.hour_var, width=4 )
         hour_spinbox.pack ( side=tk.LEFT )
         ttk.Label ( time_frame, text=" : " ).pack ( side=tk.LEFT, padx=2 )
 
-        self.minute_var = tk.IntVar ( value=self.config.get ( "schedule", {} ).get ( "minute", 30 ) )
         minute_spinbox = ttk.Spinbox ( time_frame, from_=0, to=59, textvariable=self.minute_var, width=4 )
         minute_spinbox.pack ( side=tk.LEFT )
 
@@ -536,7 +707,6 @@ class HealthCheckGUI:
         browser_grid_frame = ttk.Frame ( browser_frame )
         browser_grid_frame.pack ( fill=tk.X )
 
-        self.headless_var = tk.BooleanVar ( value=self.config.get ( "browser", {} ).get ( "headless", True ) )
         headless_check = ttk.Checkbutton ( browser_grid_frame, text="后台运行模式",
                                            variable=self.headless_var )
         headless_check.grid ( row=0, column=0, sticky=tk.W, padx=5, pady=3 )
@@ -556,14 +726,40 @@ class HealthCheckGUI:
                                              style='Accent.TButton' )
         self.save_settings_btn.pack ( fill=tk.X )
 
-        # 绑定鼠标滚轮事件
+        # 绑定鼠标滚轮事件 - 仅在鼠标位于设置页面画布内时生效，避免全局绑定
         def _on_mousewheel(event):
             canvas.yview_scroll ( int ( -1 * (event.delta / 120) ), "units" )
 
-        canvas.bind_all ( "<MouseWheel>", _on_mousewheel )
+        canvas.bind ( "<Enter>", lambda e: canvas.bind_all ( "<MouseWheel>", _on_mousewheel ) )
+        canvas.bind ( "<Leave>", lambda e: canvas.unbind_all ( "<MouseWheel>" ) )
+
+    def _on_phone_changed(self, *args):
+        """电话号码变化时防抖，停止输入150毫秒后再校验"""
+        if self._phone_after_id is not None:
+            self.root.after_cancel(self._phone_after_id)
+        self._phone_after_id = self.root.after(150, self._validate_phone_now)
+
+    def _validate_phone_now(self):
+        """校验电话号码：仅保留数字且不超过11位，11位时显示为绿色表示输入正确"""
+        self._phone_after_id = None
+        value = self.phone_var.get()
+        digits = "".join(ch for ch in value if ch.isdigit())[:11]
+        if digits != value:
+            self.phone_var.set(digits)
+
+        fg = "green" if len(digits) == 11 else "black"
+        if fg != self._phone_fg:
+            self.phone_entry.configure(foreground=fg)
+            self._phone_fg = fg
 
     def _show_function(self, function_name):
         """显示指定功能页面"""
+        # 首次打开设置页面时才创建其控件
+        if function_name == 'settings' and 'settings' not in self.pages:
+            self.settings_page = ttk.Frame ( self.pages_parent )
+            self._create_settings_page ( self.settings_page )
+            self.pages['settings'] = self.settings_page
+
         # 隐藏所有页面
         for page in self.pages.values():
             page.pack_forget()
@@ -595,19 +791,39 @@ class HealthCheckGUI:
         self.add_status_message ( "🖥️ Windows系统下仅支持Microsoft Edge浏览器" )
 
     def load_config(self):
-        """加载配置文件 - 配置文件不存在时直接报错"""
+        """加载配置文件到self.config - 配置文件不存在时直接报错，文件未变化时沿用内存中的配置"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                # 
-                return config
-            else:
+            try:
+                mtime = os.stat(self.config_file).st_mtime_ns
+            except FileNotFoundError:
                 error_msg = f"配置文件不存在: {self.config_file}\n请确保配置文件存在于程序目录中"
                 # 延迟显示错误消息 - 确保在 GUI 完全初始化后
                 self.root.after(300, lambda: self.add_status_message(f"❌ {error_msg}"))
                 error(error_msg)
                 raise FileNotFoundError(error_msg)
+
+            # 文件未变化时直接返回内存中的配置，避免重复读取和解析
+            # （对self.config的修改都会立即通过save_config写回并更新_config_mtime）
+            if self.config is not None and mtime == self._config_mtime:
+                return self.config
+
+            if ORJSON_AVAILABLE:
+                with open(self.config_file, 'rb') as f:
+                    config = orjson.loads(f.read())
+            else:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+            # 调度设置合并到共享字典中，核心模块持有的引用保持有效
+            view = getattr(self, '_schedule_view', None)
+            if view is not None:
+                new_schedule = config.get("schedule", {})
+                view.update(new_schedule)
+                for key in [k for k in view if k not in new_schedule]:
+                    del view[key]
+                config["schedule"] = view
+            self.config = config
+            self._config_mtime = mtime
+            return config
         except FileNotFoundError:
             # 直接重新抛出，不创建默认配置
             raise
@@ -619,42 +835,80 @@ class HealthCheckGUI:
             raise
 
     def save_config(self):
-        """保存配置文件"""
+        """保存配置文件 - 先写入临时文件再替换，读取方不会读到写了一半的配置"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            # 先序列化为完整内容再一次性写入，避免json.dump逐段写入（保留缩进，方便手动编辑）
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(self.config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(self.config, ensure_ascii=False, indent=2).encode('utf-8')
             
+            # 内容与上次写入相同且文件之后未被修改时无需重复写入
+            if payload == self._last_written_bytes and os.stat(self.config_file).st_mtime_ns == self._config_mtime:
+                return True
+            
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, self.config_file)
+            self._last_written_bytes = payload
+            
+            # 写入后记录新的修改时间，内存中的配置即为最新内容
+            self._config_mtime = os.stat(self.config_file).st_mtime_ns
             return True
         except Exception as e:
             self.add_status_message ( f"❌ 保存配置文件失败: {e}" )
-            error ( f"保存配置文件失败: {e}" )
+            error ( "保存配置文件失败: %s", e )
             return False
 
     def add_status_message(self, message):
-        """添加状态消息到显示框 - 优化版"""
+        """添加状态消息 - 只放入队列，由主循环定期合并写入显示框（可从任意线程调用，不接触Tk）"""
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            t = time.localtime(now)
+            # 先更新字符串再更新秒数，其他线程看到新秒数时字符串已是最新
+            self._last_ts_str = f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+            self._last_ts_sec = now
+        self._log_queue.append(f"[{self._last_ts_str}] {message}\n")
+
+    def _flush_logs(self):
+        """在主循环中定期运行，写入队列中的日志消息后安排下一次写入"""
+        try:
+            self._write_queued_logs()
+        finally:
+            if self._running and self.root:
+                self.root.after(_LOG_FLUSH_INTERVAL_MS, self._flush_logs)
+
+    def _write_queued_logs(self):
+        """将队列中的日志消息合并为一次插入，减少文本控件的更新和重绘"""
         if not self.status_text:
+            self._log_queue.clear()
             return
-            
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        full_message = f"[{timestamp}] {message}\n"
 
-        # 使用更高效的方式插入文本
-        self.status_text.insert(tk.END, full_message)
+        buf = []
+        while self._log_queue:
+            buf.append(self._log_queue.popleft())
+        if not buf:
+            return
+        text = "".join(buf)
+
+        self.status_text.insert(tk.END, text)
         self.status_text.see(tk.END)
 
-        # 优化历史记录清理 - 减少到50行以节省内存
-        # 直接计算行数而不分割整个文本
-        line_count = int(self.status_text.index('end-1c').split('.')[0])
-        if line_count > 50:
-            self.status_text.delete("1.0", f"{line_count-50}.0")
+        # 优化历史记录清理 - 自行计数行数，超出上限一定数量后再批量删除最早的日志
+        self._log_line_count += text.count("\n")
+        if self._log_line_count >= _LOG_MAX_LINES + _LOG_TRIM_BATCH:
+            excess = self._log_line_count - _LOG_MAX_LINES
+            self.status_text.delete("1.0", f"{excess + 1}.0")
+            self._log_line_count = _LOG_MAX_LINES
 
     def manual_checkin(self):
         """立即打卡一次 - 调用真实的核心代码"""
+        done = threading.Event()
 
-        def checkin_thread():
+        def checkin_job():
             try:
                 self.add_status_message ( "🚀 开始执行健康打卡..." )
-                self.manual_checkin_btn.configure ( state='disabled' )
 
                 # 调用核心代码的真实打卡功能
                 success, message = self.real_checkin ()
@@ -667,45 +921,39 @@ class HealthCheckGUI:
             except Exception as e:
                 self.add_status_message ( f"❌ 打卡出错: {str ( e )}" )
             finally:
-                self.manual_checkin_btn.configure ( state='normal' )
+                done.set()
 
-        # 在新线程中执行打卡
-        thread = threading.Thread ( target=checkin_thread )
-        thread.daemon = True
-        thread.start ()
+        # 按钮状态只在主线程中修改；打卡交给工作线程排队执行，与定时打卡串行
+        self.manual_checkin_btn.configure ( state='disabled' )
+        self._job_q.put ( checkin_job )
+        self.root.after ( 200, self._poll_manual_checkin, done )
+
+    def _poll_manual_checkin(self, done):
+        """在主线程中轮询手动打卡是否完成，完成后恢复按钮"""
+        if not self._running:
+            return
+        if done.is_set():
+            self.manual_checkin_btn.configure ( state='normal' )
+        else:
+            self.root.after ( 200, self._poll_manual_checkin, done )
 
 
     
     def real_checkin(self):
         """Windows系统下使用核心模块执行打卡（仅支持EDGE浏览器）"""
         try:
-            # Windows系统下的延迟导入
-            from health_check_core import HealthCheckAutomation
+            # 核心模块已在启动时由后台线程预先导入，此处只是取用
+            HealthCheckAutomation = _get_hca()
+            if HealthCheckAutomation is None:
+                return False, "核心模块导入失败，请确保 health_check_core.py 文件存在"
             
             # 使用单例模式获取核心实例（Windows专用配置）
             self._core_instance = HealthCheckAutomation.get_instance()
-            self._core_scheduler_available = True
             self.add_status_message("✅ 健康检查核心已初始化并保持活动状态")
             self.add_status_message("🔧 Windows环境下配置EDGE浏览器驱动")
-
-            # 检查并同步调度设置
-            if hasattr(self._core_instance, 'schedule_config') and self.config.get('schedule', {}).get('enabled', True):
-                # 同步GUI的调度设置到核心模块
-                self._core_instance.schedule_config = self.config['schedule']
-                # 如果核心模块调度器未启动，则启动它
-                if hasattr(self._core_instance, 'start_combined_thread'):
-                    self._core_instance.start_combined_thread()
-                    self.add_status_message("🔄 核心调度器已启动，将处理自动打卡任务")
-                    # 确保本地调度器停止，避免重复执行
-                    if self._local_scheduler_running:
-                        if hasattr(self, '_local_timer') and self._local_timer is not None:
-                            self._local_timer.cancel()
-                            self._local_timer = None
-                        self._local_scheduler_running = False
-                        info("已停止本地调度器，切换到核心调度器")
             
-            # 确保使用最新的配置（重新加载配置文件）
-            self._core_instance.load_or_create_config()
+            self._sync_core_config()
+            # 每次打卡后核心模块会释放用户和浏览器参数，此处仅从内存中的配置恢复
             self._core_instance.setup_automation()
 
             # 执行打卡
@@ -724,44 +972,43 @@ class HealthCheckGUI:
             else:
                 return False, "打卡失败，请检查网络连接和配置信息"
 
-        except ImportError:
-            self._core_scheduler_available = False
-            return False, "核心模块导入失败，请确保 health_check_core.py 文件存在"
         except Exception as e:
-            self._core_scheduler_available = False
-            error(f"执行打卡时出错: {str(e)}")
+            error("执行打卡时出错: %s", e)
             return False, f"执行过程中出错: {str(e)}"
 
 
 
     def update_status_display(self):
-        """更新状态显示"""
-        # 更新用户信息显示
-        user_info = self.config.get ( "user_info", {} )
-        self.display_name_label.configure ( text=user_info.get ( "name", "未设置" ), foreground='blue' )
-        self.display_phone_label.configure ( text=user_info.get ( "phone", "未设置" ), foreground='blue' )
-        self.display_unit_label.configure ( text=user_info.get ( "unit", "未设置" ), foreground='blue' )
-
-        # 更新自动打卡信息
-        schedule_config = self.config.get ( "schedule", {} )
+        """更新状态显示 - 先生成标签内容快照，在空闲时一次性应用"""
+        user_info, schedule_config, browser_config = self._sections ()
+        hour = schedule_config.get ( "hour", 10 )
+        minute = schedule_config.get ( "minute", 30 )
         auto_enabled = schedule_config.get ( "enabled", False )
-        if auto_enabled:
-            self.auto_checkin_label.configure ( text="开启", foreground='green' )
-        else:
-            self.auto_checkin_label.configure ( text="关闭", foreground='red' )
-
-        # 格式化显示打卡时间
-        hour = schedule_config.get("hour", 10)
-        minute = schedule_config.get("minute", 30)
-        self.checkin_time_label.configure(text=f"{hour:02d}:{minute:02d}", foreground='blue')
-
-        # 更新浏览器信息
-        browser_config = self.config.get ( "browser", {} )
         headless = browser_config.get ( "headless", True )
-        if headless:
-            self.headless_label.configure ( text="开启", foreground='green' )
-        else:
-            self.headless_label.configure ( text="关闭", foreground='red' )
+
+        snapshot = [
+            # 用户信息
+            (self.display_name_label, user_info.get ( "name", "未设置" ), 'blue'),
+            (self.display_phone_label, user_info.get ( "phone", "未设置" ), 'blue'),
+            (self.display_unit_label, user_info.get ( "unit", "未设置" ), 'blue'),
+            # 自动打卡信息
+            (self.auto_checkin_label, "开启" if auto_enabled else "关闭", 'green' if auto_enabled else 'red'),
+            (self.checkin_time_label, f"{hour:02d}:{minute:02d}", 'blue'),
+            # 浏览器信息
+            (self.headless_label, "开启" if headless else "关闭", 'green' if headless else 'red'),
+        ]
+
+        # 已安排空闲回调时只替换快照，多次调用合并为一次界面更新
+        pending = self._status_snapshot is not None
+        self._status_snapshot = snapshot
+        if not pending:
+            self.root.after_idle ( self._apply_status_updates )
+
+    def _apply_status_updates(self):
+        """在主线程空闲时将最新的标签快照应用到状态页"""
+        snapshot, self._status_snapshot = self._status_snapshot, None
+        for label, text, fg in snapshot or ():
+            label.configure ( text=text, foreground=fg )
 
     def save_settings(self):
         """保存设置"""
@@ -773,30 +1020,24 @@ class HealthCheckGUI:
                 return
             
             # 更新配置
-            if "user_info" not in self.config:
-                self.config["user_info"] = {}
-            if "schedule" not in self.config:
-                self.config["schedule"] = {}
-            if "browser" not in self.config:
-                self.config["browser"] = {}
+            user_info, schedule_config, browser_config = self._sections ()
 
             # 用户信息
-            self.config["user_info"]["name"] = self.name_var.get ()
-            self.config["user_info"]["phone"] = phone_value
-            self.config["user_info"]["unit"] = self.unit_var.get ()
-            self.config["user_info"]["temperature"] = self.temperature_var.get ()
+            user_info["name"] = self.name_var.get ()
+            user_info["phone"] = phone_value
+            user_info["unit"] = self.unit_var.get ()
+            user_info["temperature"] = self.temperature_var.get ()
 
             # 打卡设置 - 自动打卡始终保持启用状态
-            self.config["schedule"]["hour"] = self.hour_var.get ()
-            self.config["schedule"]["minute"] = self.minute_var.get ()
-            self.config["schedule"]["enabled"] = True  # 强制启用自动打卡
+            schedule_config["hour"] = self.hour_var.get ()
+            schedule_config["minute"] = self.minute_var.get ()
+            schedule_config["enabled"] = True  # 强制启用自动打卡
 
             # 浏览器设置
-            self.config["browser"]["headless"] = self.headless_var.get ()
+            browser_config["headless"] = self.headless_var.get ()
 
             if self.save_config():
-                # 保存成功后重新读取配置文件
-                self.config = self.load_config()
+                # 内存中的配置已是最新内容，无需重新读取配置文件
                 self.add_status_message("✅ 设置已保存成功")
                 messagebox.showinfo("成功", "所有设置已保存成功")
                 self.update_status_display()
@@ -814,22 +1055,20 @@ class HealthCheckGUI:
         try:
             # 从配置文件重新加载最新配置
             self.load_config()
+            user_info, schedule_config, browser_config = self._sections ()
             
             # 用户信息
-            user_info = self.config.get ( "user_info", {} )
             self.name_var.set ( user_info.get ( "name", "" ) )
             self.phone_var.set ( user_info.get ( "phone", "" ) )
             self.unit_var.set ( user_info.get ( "unit", "" ) )
             self.temperature_var.set ( user_info.get ( "temperature", "36.5" ) )
 
             # 打卡设置
-            schedule_config = self.config.get ( "schedule", {} )
             self.hour_var.set ( schedule_config.get ( "hour", 10 ) )
             self.minute_var.set ( schedule_config.get ( "minute", 30 ) )
             # 自动打卡始终启用，无需设置变量
 
             # 浏览器设置
-            browser_config = self.config.get ( "browser", {} )
             self.headless_var.set ( browser_config.get ( "headless", True ) )
 
             # 更新状态显示
@@ -839,7 +1078,7 @@ class HealthCheckGUI:
             self.add_status_message("🕒 自动打卡功能已启用")
         except Exception as e:
             self.add_status_message(f"⚠️ 加载设置时出现问题: {str(e)}")
-            warning(f"加载设置失败: {e}")
+            warning("加载设置失败: %s", e)
 
     def on_auto_enabled_changed(self):
         """自动打卡功能处理（始终启用）"""
@@ -851,161 +1090,111 @@ class HealthCheckGUI:
         self.update_status_display ()
 
     def schedule_auto_checkin(self, hour=None, minute=None):
-        """优化版统一调度机制 - 支持核心模块调度器共享和同步"""
+        """统一调度入口 - 更新配置后交给启动时选定的调度器重新设置时间"""
         # 获取时间参数
         if hour is None:
             hour = self.hour_var.get()
         if minute is None:
             minute = self.minute_var.get()
+        
+        # 时间未变化且调度器已按该时间设置时无需重新设置
+        key = (hour, minute)
+        if key == self._armed_hm and self._scheduler is not None:
+            return
+        self._armed_hm = None
             
         try:
             # 更新配置文件中的时间设置
             self._update_schedule_config(hour, minute)
             
+            if self._scheduler is None:
+                self._scheduler = self._resolve_scheduler()
+            self._scheduler.set_time(hour, minute)
+            self._armed_hm = key
+            
             # 添加状态消息
             self.add_status_message(f"⏰ 自动打卡已设置为每天 {hour:02d}:{minute:02d}")
-            
-            # 检查核心实例是否存在且可用
-            if self._core_instance and self._core_scheduler_available:
-                # 同步最新的调度设置到核心实例
-                self._core_instance.schedule_config = self.config['schedule']
-                
-                # 检查核心实例是否有running属性和start_combined_thread方法
-                if hasattr(self._core_instance, 'running') and hasattr(self._core_instance, 'start_combined_thread'):
-                    # 如果核心调度器未运行，则启动它
-                    if not self._core_instance.running:
-                        self._core_instance.start_combined_thread()
-                        info(f"核心调度器已启动，设置时间：{hour:02d}:{minute:02d}")
-                    else:
-                        # 核心调度器已运行，它会自动检测配置变化
-                        info(f"核心调度器已在运行，将使用新设置：{hour:02d}:{minute:02d}")
-                
-                # 确保本地调度器停止，避免重复执行
-                if self._local_scheduler_running:
-                    if hasattr(self, '_local_timer') and self._local_timer is not None:
-                        self._local_timer.cancel()
-                        self._local_timer = None
-                    self._local_scheduler_running = False
-                    info("已停止本地调度器，统一使用核心调度器")
-            else:
-                # 如果核心实例不存在或不可用，先尝试延迟创建核心实例
-                try:
-                    from health_check_core import HealthCheckAutomation
-                    self._core_instance = HealthCheckAutomation.get_instance()
-                    self._core_scheduler_available = True
-                    
-                    # 配置并启动核心调度器
-                    self._core_instance.schedule_config = self.config['schedule']
-                    if hasattr(self._core_instance, 'start_combined_thread'):
-                        self._core_instance.start_combined_thread()
-                        self.add_status_message("🔄 已启动核心调度器处理自动打卡")
-                        self._local_scheduler_running = False
-                        if hasattr(self, '_local_timer') and self._local_timer is not None:
-                            self._local_timer.cancel()
-                            self._local_timer = None
-                except Exception as inner_e:
-                    # 创建核心实例失败，回退到本地调度器
-                    self._core_scheduler_available = False
-                    info(f"无法创建核心调度器实例: {str(inner_e)}，回退到本地调度")
-                    self._fallback_to_local_scheduler(hour, minute)
         except Exception as e:
             self.add_status_message(f"❌ 设置自动打卡时出错: {str(e)}")
-            error(f"设置自动打卡时出错: {str(e)}")
-            # 出错时回退到本地调度
-            self._fallback_to_local_scheduler(hour, minute)
+            error("设置自动打卡时出错: %s", e)
+            # 核心调度器出错时回退到本地调度，保证始终只有一个调度器在运行
+            if not isinstance(self._scheduler, LocalTimerAdapter):
+                if self._scheduler is not None:
+                    try:
+                        self._scheduler.stop()
+                    except Exception:
+                        pass
+                self._scheduler = LocalTimerAdapter(self.scheduled_checkin)
+                self._scheduler.set_time(hour, minute)
+                self._armed_hm = key
+                self.add_status_message(f"📌 已回退到本地定时，设置每日 {hour:02d}:{minute:02d} 自动打卡")
+
+    def _resolve_scheduler(self):
+        """选择自动打卡使用的调度器 - 优先使用核心模块调度器，核心模块不可用时使用本地定时器"""
+        HealthCheckAutomation = _get_hca()
+        if HealthCheckAutomation is None:
+            info("无法创建核心调度器实例，回退到本地调度")
+            self.add_status_message("📌 核心模块不可用，已回退到本地定时")
+            return LocalTimerAdapter(self.scheduled_checkin)
+        
+        self._core_instance = HealthCheckAutomation.get_instance()
+        self.add_status_message("🔄 已启动核心调度器处理自动打卡")
+        return CoreSchedulerAdapter(self._core_instance, self._schedule_view)
             
     def _update_schedule_config(self, hour, minute):
-        """更新调度配置"""
-        if "schedule" not in self.config:
-            self.config["schedule"] = {}
-        self.config["schedule"]["enabled"] = True
-        self.config["schedule"]["hour"] = hour
-        self.config["schedule"]["minute"] = minute
+        """更新调度配置（原地修改共享的调度设置字典）"""
+        view = self._schedule_view
+        view["enabled"] = True
+        view["hour"] = hour
+        view["minute"] = minute
         self.save_config()
-            
-    def _fallback_to_local_scheduler(self, hour, minute):
-        """回退到本地threading.Timer实现的辅助方法"""
-        # 设置本地调度器运行标志
-        self._local_scheduler_running = True
-        
-        # 创建本地定时器线程
-        if not hasattr(self, '_local_timer') or self._local_timer is None:
-            self._schedule_local_timer(hour, minute)
-            self.add_status_message(f"📌 已回退到本地定时，设置每日 {hour:02d}:{minute:02d} 自动打卡")
-            info(f"本地定时器已启用，打卡时间：{hour:02d}:{minute:02d}")
-        else:
-            # 更新现有定时器
-            self._update_local_timer(hour, minute)
-    
-    def _schedule_local_timer(self, hour, minute):
-        """设置本地threading.Timer"""
-        # 计算下次执行时间
-        now = datetime.now()
-        target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        if target_time <= now:
-            # 如果目标时间已过，设置为明天
-            from datetime import timedelta
-            target_time += timedelta(days=1)
-        
-        # 计算延迟时间
-        delay = (target_time - now).total_seconds()
-        
-        # 创建并启动定时器
-        self._local_timer = threading.Timer(delay, self._local_timer_callback)
-        self._local_timer.daemon = True
-        self._local_timer.start()
-        
-        # 保存当前设置的时间
-        self._local_timer_hour = hour
-        self._local_timer_minute = minute
-    
-    def _update_local_timer(self, hour, minute):
-        """更新本地定时器"""
-        # 取消现有定时器
-        if hasattr(self, '_local_timer') and self._local_timer is not None:
-            self._local_timer.cancel()
-            self._local_timer = None
-        
-        # 设置新定时器
-        self._schedule_local_timer(hour, minute)
-    
-    def _local_timer_callback(self):
-        """本地定时器回调函数"""
-        # 执行打卡任务
-        self.scheduled_checkin()
-        
-        # 重新调度下一次执行
-        if hasattr(self, '_local_timer_hour') and hasattr(self, '_local_timer_minute'):
-            self._schedule_local_timer(self._local_timer_hour, self._local_timer_minute)
-
 
+    def _worker_loop(self):
+        """工作线程主循环 - 阻塞等待任务并依次执行"""
+        while True:
+            job = self._job_q.get()
+            try:
+                job()
+            except Exception as e:
+                error("后台任务执行出错: %s", e)
+            finally:
+                self._job_q.task_done()
 
     def scheduled_checkin(self):
         """定时打卡任务"""
-        # 在新线程中执行打卡，避免阻塞调度器
-        thread = threading.Thread(target=self._scheduled_checkin_thread)
-        thread.daemon = True
-        thread.start()
+        # 交给工作线程执行，避免阻塞调度器；已有打卡任务排队时不再重复加入
+        if self._job_q.empty():
+            self._job_q.put(self._scheduled_checkin_thread)
+        else:
+            info("已有打卡任务等待执行，跳过本次定时触发")
         
+    def _sync_core_config(self):
+        """仅在首次使用或配置文件变化后让核心实例重新加载配置，避免每次打卡都读取解析文件"""
+        try:
+            config_mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            config_mtime = None
+        if self._core_cfg_mtime is None or config_mtime != self._core_cfg_mtime:
+            self._core_instance.load_or_create_config()
+            self._core_cfg_mtime = config_mtime
+
     def _scheduled_checkin_thread(self):
         """定时打卡线程函数 - 支持核心模块共享实例"""
         self.add_status_message("⌛ 开始定时打卡任务...")
         
         try:
             # 检查是否有可用的核心实例
-            if self._core_instance and self._core_scheduler_available:
+            if self._core_instance:
                 info("使用已初始化的核心实例执行定时打卡")
-                # 确保配置是最新的
-                self._core_instance.load_or_create_config()
                 
-            # 执行打卡（real_checkin方法中已实现延迟导入和核心实例共享）
+            # 执行打卡（real_checkin方法中已实现延迟导入和核心实例共享，配置文件变化时才重新加载）
             success, message = self.real_checkin()
             if success:
                 self.add_status_message(f"✅ {message}")
-                info(f"定时打卡成功: {message}")
+                info("定时打卡成功: %s", message)
             else:
                 self.add_status_message(f"❌ {message}")
-                error(f"定时打卡失败: {message}")
+                error("定时打卡失败: %s", message)
             
         except Exception as e:
             error_msg = f"定时打卡线程发生异常: {str(e)}"
@@ -1026,9 +1215,9 @@ class HealthCheckGUI:
         """
 
         # 记录当前使用的调度器类型
-        if self._core_scheduler_available:
+        if isinstance(self._scheduler, CoreSchedulerAdapter):
             info("应用启动 - 使用核心模块调度器")
-        elif self._local_scheduler_running:
+        elif isinstance(self._scheduler, LocalTimerAdapter):
             info("应用启动 - 使用本地调度器")
         else:
             info("应用启动 - 等待用户操作或调度设置")
@@ -5,8 +5,10 @@
 提供基本的日志配置功能，使用Python标准库logging
 """
 
+import collections
 import logging
 import os
+import time
 from pathlib import Path
 
 # 定义日志级别常量，保持与原系统兼容
@@ -30,30 +32,103 @@ class StreamHandler:
     """流处理器，保持接口兼容"""
     pass
 
+class CachingFormatter(logging.Formatter):
+    """按秒缓存asctime的格式化器，同一秒内的日志复用已格式化的时间字符串"""
+    def __init__(self, fmt=None, datefmt=None, style='%'):
+        super().__init__(fmt, datefmt, style)
+        self._cached = (None, '')  # (整秒时间戳, 格式化后的时间)，整体替换以保证多线程下成对读取
+    
+    def formatTime(self, record, datefmt=None):
+        """格式化日志时间，未指定datefmt时使用默认格式（含毫秒，不缓存）"""
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached_sec, cached_str = self._cached
+        if sec == cached_sec:
+            return cached_str
+        asctime = time.strftime(datefmt, self.converter(sec))
+        self._cached = (sec, asctime)
+        return asctime
+
+# 默认日志格式，所有处理器共用同一个格式化器实例，同一秒内的时间字符串只格式化一次
+_DEFAULT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_DEFAULT_DATEFMT = '%Y-%m-%d %H:%M:%S'
+_FORMATTER = CachingFormatter(_DEFAULT_FORMAT, datefmt=_DEFAULT_DATEFMT)
+
 class GUILogHandler(logging.Handler):
-    """自定义GUI日志处理器，将日志消息发送到GUI界面"""
+    """自定义GUI日志处理器，将日志消息发送到GUI界面
+    
+    emit可能在任意线程中调用，只把格式化后的消息放入缓冲区，不接触Tk；
+    install_drain在主线程中启动周期性的取出任务，由Tk主循环统一交给GUI回调显示。
+    GUI回调设置之前的日志记录暂存在_pending中（不格式化），设置回调时再统一处理
+    """
+    _DRAIN_INTERVAL_MS = 150  # 主循环取出缓冲区消息的间隔
+    
     def __init__(self, gui_callback=None):
         super().__init__()
         self.gui_callback = gui_callback
+        self._buf = collections.deque(maxlen=2000)  # 待显示的日志消息
+        self._root = None  # 负责取出消息的Tk主窗口
+        self._pending = collections.deque(maxlen=500)  # GUI回调设置之前的日志记录，只保留最新的部分
     
     def set_gui_callback(self, callback):
-        """设置GUI回调函数"""
+        """设置GUI回调函数，并把此前暂存的日志记录格式化后放入缓冲区"""
         self.gui_callback = callback
+        if callback is not None:
+            self._format_pending()
+    
+    def _format_pending(self):
+        """把暂存的日志记录格式化后放入缓冲区"""
+        pending = self._pending
+        while pending:
+            record = pending.popleft()
+            try:
+                self._buf.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+    
+    def install_drain(self, root):
+        """绑定Tk主窗口并启动周期性取出任务，必须在主线程中调用"""
+        self._root = root
+        root.after(self._DRAIN_INTERVAL_MS, self._drain)
     
     def emit(self, record):
-        """处理日志记录，发送到GUI"""
+        """处理日志记录，放入缓冲区等待主循环取出"""
+        # GUI尚未就绪时只暂存记录，不进行格式化
+        if self.gui_callback is None:
+            self._pending.append(record)
+            return
         try:
-            # 格式化日志记录
-            msg = self.format(record)
-            if self.gui_callback:
-                # 调用GUI回调函数显示日志
-                self.gui_callback(msg)
+            self._buf.append(self.format(record))
         except Exception:
             self.handleError(record)
+    
+    def _drain(self):
+        """在Tk主循环中取出缓冲区的全部消息交给GUI回调，然后安排下一次取出"""
+        callback = self.gui_callback
+        try:
+            if callback:
+                # 回调设置期间其他线程可能仍写入了_pending，一并处理
+                if self._pending:
+                    self._format_pending()
+                buf = self._buf
+                while buf:
+                    callback(buf.popleft())
+        finally:
+            root = self._root
+            if root is not None:
+                try:
+                    root.after(self._DRAIN_INTERVAL_MS, self._drain)
+                except Exception:
+                    # 窗口已销毁，主循环已结束
+                    self._root = None
 
 # 创建全局GUI日志处理器实例
 gui_log_handler = GUILogHandler()
 
+# 根日志记录器的处理器是否已由basicConfig安装，避免重复添加导致每条日志被多次输出
+_CONFIGURED = False
+
 def setup_logger(name=__name__, level=logging.INFO, log_file=None):
     """
     设置日志记录器
@@ -71,16 +146,16 @@ def setup_logger(name=__name__, level=logging.INFO, log_file=None):
     
     # 避免重复添加处理器
     if not logger.handlers:
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', 
-                                     datefmt='%Y-%m-%d %H:%M:%S')
+        # 已有独立的处理器，不再传递给根日志记录器，避免同一条日志被输出两次
+        logger.propagate = False
         
         # 添加控制台处理器
         console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FORMATTER)
         logger.addHandler(console_handler)
         
         # 添加GUI日志处理器
-        gui_log_handler.setFormatter(formatter)
+        gui_log_handler.setFormatter(_FORMATTER)
         logger.addHandler(gui_log_handler)
         
         # 添加文件处理器（如果指定了日志文件）
@@ -89,7 +164,7 @@ def setup_logger(name=__name__, level=logging.INFO, log_file=None):
             if log_dir:
                 Path(log_dir).mkdir(exist_ok=True)
             file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(_FORMATTER)
             logger.addHandler(file_handler)
     
     return logger
@@ -118,10 +193,12 @@ def basicConfig(**kwargs):
     Returns:
         logging.Logger: 根日志记录器
     """
+    global _CONFIGURED
+    
     # 提取配置参数
     level = kwargs.get('level', logging.INFO)
-    format_str = kwargs.get('format', '%(asctime)s - %(levelname)s - %(message)s')
-    datefmt = kwargs.get('datefmt', '%Y-%m-%d %H:%M:%S')
+    format_str = kwargs.get('format', _DEFAULT_FORMAT)
+    datefmt = kwargs.get('datefmt', _DEFAULT_DATEFMT)
     filename = kwargs.get('filename')
     handlers = kwargs.get('handlers', [])
     
@@ -129,12 +206,20 @@ def basicConfig(**kwargs):
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     
+    # 处理器已安装时只更新日志级别
+    if _CONFIGURED:
+        return root_logger
+    
     # 清除已有的处理器
     if root_logger.handlers:
         root_logger.handlers.clear()
     
     # 创建格式化器
-    formatter = logging.Formatter(format_str, datefmt=datefmt)
+    # 使用默认格式时共用模块级格式化器，自定义格式时才新建
+    if format_str == _DEFAULT_FORMAT and datefmt == _DEFAULT_DATEFMT:
+        formatter = _FORMATTER
+    else:
+        formatter = CachingFormatter(format_str, datefmt=datefmt)
     
     # 如果指定了文件名，添加文件处理器
     if filename:
@@ -169,30 +254,15 @@ def basicConfig(**kwargs):
     gui_log_handler.setFormatter(formatter)
     root_logger.addHandler(gui_log_handler)
     
+    _CONFIGURED = True
     return root_logger
 
-# 为了保持完全兼容性，添加直接的全局函数
-def debug(msg, *args, **kwargs):
-    """记录DEBUG级别的全局日志"""
-    _root_logger = logging.getLogger()
-    _root_logger.debug(msg, *args, **kwargs)
-
-def info(msg, *args, **kwargs):
-    """记录INFO级别的全局日志"""
-    _root_logger = logging.getLogger()
-    _root_logger.info(msg, *args, **kwargs)
-
-def warning(msg, *args, **kwargs):
-    """记录WARNING级别的全局日志"""
-    _root_logger = logging.getLogger()
-    _root_logger.warning(msg, *args, **kwargs)
-
-def error(msg, *args, **kwargs):
-    """记录ERROR级别的全局日志"""
-    _root_logger = logging.getLogger()
-    _root_logger.error(msg, *args, **kwargs)
-
-def critical(msg, *args, **kwargs):
-    """记录CRITICAL级别的全局日志"""
-    _root_logger = logging.getLogger()
-    _root_logger.critical(msg, *args, **kwargs)
\ No newline at end of file
+# 为了保持完全兼容性，提供直接的全局函数
+# 导入时取得一次根日志记录器并直接绑定其方法，调用时不再查找日志记录器，也没有额外的包装函数
+# （各方法内部已先检查isEnabledFor，级别未启用时立即返回）
+_root_logger = logging.getLogger()
+debug = _root_logger.debug
+info = _root_logger.info
+warning = _root_logger.warning
+error = _root_logger.error
+critical = _root_logger.critical